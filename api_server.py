@@ -50,12 +50,16 @@ try:
     from microbot.features.notes import NotesManager
     from microbot.features.voice import VoiceManager
     from microbot.core.simple_chat_manager import SimpleChatManager
+    from microbot.utils.logging_setup import setup_logging
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Please ensure all required modules are installed.")
     print("Run: pip install -r requirements.txt")
     sys.exit(1)
 
+# Microbot modules log through a background queue listener
+setup_logging()
+
 
 # ============================================================================
 # Expression Selection System - DISABLED (Will be reimplemented later)
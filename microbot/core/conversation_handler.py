@@ -24,9 +24,13 @@ class ConversationHandler:
     Pure AI-driven conversation handler - no pattern matching
     """
     
-    def __init__(self):
+    def __init__(self, config=None):
+        """
+        Args:
+            config: Shared ConfigStore used for the reply language (optional)
+        """
         # Only keep table functionality - everything else handled by AI
-        pass
+        self.config = config
     
     def get_special_response(self, user_input: str) -> Optional[str]:
         """
@@ -51,8 +55,10 @@ class ConversationHandler:
             # Apply childification if not serious (only for Hinglish)
             if not looks_serious(user_input):
                 try:
-                    from ..utils import ConfigStore
-                    config = ConfigStore()
+                    config = self.config
+                    if config is None:
+                        from ..utils import ConfigStore
+                        config = self.config = ConfigStore()
                     answer = childify(answer, config.language())
                 except:
                     answer = childify(answer)
@@ -48,7 +48,7 @@ class SimpleChatManager:
             SupportedLanguage.HINGLISH if self.config.language() == "hinglish" 
             else SupportedLanguage.ENGLISH
         )
-        self.conversation_handler = ConversationHandler()
+        self.conversation_handler = ConversationHandler(self.config)
         self.flow_manager = FlowManager(self.config)
         
         # Initialize reminder system
@@ -7,7 +7,7 @@ Phase 1: Foundation (Noise Suppression + VAD + Better ASR)
 from __future__ import annotations
 import numpy as np
 import torch
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 import warnings
 
 # Suppress warnings for cleaner output
@@ -174,6 +174,59 @@ class SileroVAD:
         except Exception:
             return 0.5
     
+    def get_speech_probabilities_batch(self, segments: List[np.ndarray]) -> List[float]:
+        """
+        Get speech probability for several segments in batched forward passes
+        
+        Segments are zero-padded to a common length and stacked into a
+        (batch, samples) tensor, so each model call scores one chunk of
+        every segment at once.
+        
+        Args:
+            segments: 1-D audio arrays
+        
+        Returns:
+            Max chunk probability per segment (same order as input)
+        """
+        if not segments:
+            return []
+        
+        if not self.available:
+            # Energy fallback, expressed as a hard 0/1 probability
+            return [1.0 if self._fallback_vad(seg) else 0.0 for seg in segments]
+        
+        try:
+            chunk_size = 512 if self.sampling_rate == 16000 else 256
+            
+            # Pad every segment up to the longest one (rounded to whole chunks)
+            lengths = [max(len(seg), 1) for seg in segments]
+            total = -(-max(lengths) // chunk_size) * chunk_size
+            batch = np.zeros((len(segments), total), dtype=np.float32)
+            for row, seg in enumerate(segments):
+                batch[row, :len(seg)] = np.asarray(seg, dtype=np.float32).reshape(-1)
+            
+            batch_tensor = torch.from_numpy(batch)
+            lengths_arr = np.array(lengths)
+            best = np.zeros(len(segments), dtype=np.float32)
+            
+            # Batch size may differ from the previous call - start from clean state
+            self.model.reset_states()
+            
+            with torch.no_grad():
+                for i in range(0, total, chunk_size):
+                    probs = self.model(batch_tensor[:, i:i + chunk_size], self.sampling_rate)
+                    probs = probs.reshape(-1).numpy()
+                    
+                    # Only count chunks that overlap real (unpadded) audio
+                    live = lengths_arr > i
+                    best[live] = np.maximum(best[live], probs[live])
+            
+            return best.tolist()
+        
+        except Exception:
+            # Fall back to scoring segments one at a time
+            return [self.get_speech_probability(seg) for seg in segments]
+    
     def _fallback_vad(self, audio_chunk: np.ndarray) -> bool:
         """
         Simple energy-based VAD fallback
@@ -463,22 +516,10 @@ class AdvancedAudioProcessor:
         """
         self.stats["total_chunks"] += 1
         
-        metadata = {
-            "noise_suppressed": False,
-            "vad_detected": False,
-            "speech_probability": 0.0,
-            "confidence": 0.0,
-            "processing_stages": []
-        }
+        metadata = self._new_metadata()
         
         # Stage 1: Noise Suppression
-        try:
-            denoised = self.rnnoise.suppress_noise(audio, stationary=True)
-            metadata["noise_suppressed"] = True
-            metadata["processing_stages"].append("noise_suppression")
-        except Exception as e:
-            print(f"⚠️ Noise suppression failed: {e}")
-            denoised = audio
+        denoised = self._suppress_noise(audio, metadata)
         
         # Stage 2: Voice Activity Detection
         if not skip_vad:
@@ -494,7 +535,84 @@ class AdvancedAudioProcessor:
             metadata["vad_detected"] = True
             metadata["processing_stages"].append("vad_passed")
         
-        # Stage 3: Transcription with Enhanced Google SR
+        # Stages 3-4: Transcription + Confidence Filtering
+        return self._transcribe(denoised, language, metadata)
+    
+    def process_audio_batch(
+        self,
+        audios: List[np.ndarray],
+        language: str = "en"
+    ) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+        """
+        Run the pipeline over several captured segments with batched VAD
+        
+        Noise suppression and transcription still run per segment; the
+        Silero VAD forward passes are shared across the whole batch.
+        
+        Args:
+            audios: Raw audio inputs (numpy arrays)
+            language: Language code
+        
+        Returns:
+            (transcribed_text, metadata_dict) per segment, in input order
+        """
+        metadatas = []
+        denoised_all = []
+        for audio in audios:
+            self.stats["total_chunks"] += 1
+            metadata = self._new_metadata()
+            denoised_all.append(self._suppress_noise(audio, metadata))
+            metadatas.append(metadata)
+        
+        # Stage 2: one batched VAD pass for every segment
+        speech_probs = self.vad.get_speech_probabilities_batch(denoised_all)
+        
+        results = []
+        for denoised, metadata, speech_prob in zip(denoised_all, metadatas, speech_probs):
+            metadata["speech_probability"] = speech_prob
+            
+            if speech_prob <= self.vad.threshold:
+                self.stats["noise_chunks"] += 1
+                metadata["vad_detected"] = False
+                results.append((None, metadata))
+                continue
+            
+            self.stats["speech_chunks"] += 1
+            metadata["vad_detected"] = True
+            metadata["processing_stages"].append("vad_passed")
+            results.append(self._transcribe(denoised, language, metadata))
+        
+        return results
+    
+    @staticmethod
+    def _new_metadata() -> Dict[str, Any]:
+        """Fresh per-segment metadata dict"""
+        return {
+            "noise_suppressed": False,
+            "vad_detected": False,
+            "speech_probability": 0.0,
+            "confidence": 0.0,
+            "processing_stages": []
+        }
+    
+    def _suppress_noise(self, audio: np.ndarray, metadata: Dict[str, Any]) -> np.ndarray:
+        """Stage 1: Noise Suppression"""
+        try:
+            denoised = self.rnnoise.suppress_noise(audio, stationary=True)
+            metadata["noise_suppressed"] = True
+            metadata["processing_stages"].append("noise_suppression")
+            return denoised
+        except Exception as e:
+            print(f"⚠️ Noise suppression failed: {e}")
+            return audio
+    
+    def _transcribe(
+        self,
+        denoised: np.ndarray,
+        language: str,
+        metadata: Dict[str, Any]
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Stage 3: Transcription with Enhanced Google SR, Stage 4: Confidence Filtering"""
         try:
             result = self.asr.transcribe(denoised, language)
             metadata["confidence"] = result.get("confidence", 0.0)
@@ -503,7 +621,6 @@ class AdvancedAudioProcessor:
             
             self.stats["transcriptions"] += 1
             
-            # Stage 4: Confidence Filtering
             if result["confidence"] < self.confidence_threshold:
                 self.stats["low_confidence_rejections"] += 1
                 metadata["processing_stages"].append("confidence_rejected")
@@ -0,0 +1,137 @@
+"""
+PCM Utilities
+Fast int16 PCM <-> float32 conversion kernels shared by STT and TTS
+"""
+
+import threading
+import numpy as np
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# int16 PCM -> float32 [-1, 1] scale factor (exactly 1 / 32768)
+INT16_SCALE = np.float32(3.0517578125e-5)
+
+
+if NUMBA_AVAILABLE:
+    # Audio always arrives as contiguous 1-D int16 (16 kHz mono), so compile
+    # eagerly for exactly that layout: no runtime type dispatch, no first-call
+    # JIT, and the binary is reused from __pycache__ on later starts.
+    # np.frombuffer() views are read-only, which Numba types separately.
+    _I16_C = types.Array(types.int16, 1, 'C')
+    _I16_C_RO = types.Array(types.int16, 1, 'C', readonly=True)
+    _F32_C = types.Array(types.float32, 1, 'C')
+
+    @njit([types.void(_I16_C, _F32_C), types.void(_I16_C_RO, _F32_C)],
+          cache=True, fastmath=True, boundscheck=False)
+    def _i16_to_f32(src, dst):
+        """Scale int16 samples into a float32 buffer (compiled to SIMD by Numba)"""
+        for i in range(src.shape[0]):
+            dst[i] = src[i] * np.float32(3.0517578125e-5)
+
+
+def normalize_int16(src: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Normalize int16 PCM to float32 [-1, 1] in a single pass
+
+    Args:
+        src: int16 samples (read-only views are fine)
+        out: float32 destination, at least src.size long
+
+    Returns:
+        float32 view of out holding the normalized samples
+    """
+    n = src.size
+    dst = out[:n]
+    src = np.ascontiguousarray(src).reshape(-1)
+    if NUMBA_AVAILABLE:
+        _i16_to_f32(src, dst)
+    else:
+        np.multiply(src, INT16_SCALE, out=dst, dtype=np.float32, casting='unsafe')
+    return dst
+
+
+class Float32BufferPool:
+    """
+    Free-list pool of float32 buffers bucketed by power-of-two size
+
+    Lets the audio hot path reuse staging buffers across utterances
+    instead of allocating a fresh array per call.
+    """
+
+    def __init__(self, max_per_bucket: int = 2):
+        """
+        Initialize buffer pool
+
+        Args:
+            max_per_bucket: Buffers kept per size bucket; extras are dropped
+        """
+        self.max_per_bucket = max_per_bucket
+        self._free = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(n: int) -> int:
+        """Round n up to the next power of two"""
+        return 1 << max(0, n - 1).bit_length()
+
+    def acquire(self, n: int) -> np.ndarray:
+        """Get a float32 buffer with room for at least n samples"""
+        size = self._bucket(n)
+        with self._lock:
+            bucket = self._free.get(size)
+            if bucket:
+                return bucket.pop()
+        return np.empty(size, dtype=np.float32)
+
+    def release(self, buf: np.ndarray):
+        """Return a buffer obtained from acquire() to the pool"""
+        with self._lock:
+            bucket = self._free.setdefault(buf.size, [])
+            if len(bucket) < self.max_per_bucket:
+                bucket.append(buf)
+
+
+class LinearResampler:
+    """
+    Streaming linear-interpolation resampler
+
+    Carries the fractional read position and the trailing input sample
+    between calls, so audio can be resampled chunk by chunk as it arrives
+    without seams at the chunk boundaries.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int):
+        """
+        Initialize resampler
+
+        Args:
+            src_rate: Input sample rate
+            dst_rate: Output sample rate
+        """
+        self.step = src_rate / dst_rate
+        self._pos = 0.0
+        self._tail = np.empty(0, dtype=np.float32)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of float32 samples"""
+        buf = np.concatenate((self._tail, samples)) if self._tail.size else samples
+        last = buf.size - 1
+        if last < self._pos:
+            self._tail = buf
+            return np.empty(0, dtype=np.float32)
+
+        count = int((last - self._pos) // self.step) + 1
+        positions = self._pos + self.step * np.arange(count)
+        out = np.interp(positions, np.arange(buf.size), buf).astype(np.float32, copy=False)
+
+        # Keep the sample the next output interpolates from
+        next_pos = self._pos + self.step * count
+        keep = min(int(next_pos), last)
+        self._tail = buf[keep:]
+        self._pos = next_pos - keep
+        return out
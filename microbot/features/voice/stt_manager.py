@@ -5,10 +5,17 @@ PHASE 1 UPGRADE: Advanced audio processing with RNNoise, VAD, and Whisper
 
 import speech_recognition as sr
 import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Tuple
+import ctypes
+import os
+import sys
 import threading
+import time
 import queue
 
+from . import pcm_utils
+
 try:
     from .advanced_audio_processor import AdvancedAudioProcessor
     ADVANCED_PROCESSOR_AVAILABLE = True
@@ -16,6 +23,26 @@ except ImportError:
     ADVANCED_PROCESSOR_AVAILABLE = False
     print("⚠️ Advanced audio processor not available - using fallback")
 
+# Default phrase length (seconds) and capture rate used to size scratch buffers
+DEFAULT_PHRASE_TIME_LIMIT = 6
+SAMPLE_RATE = 16000
+
+# Cheap pre-VAD gate: buffers quieter than this mean-square energy, or shorter
+# than 250 ms, can't hold usable speech and skip the ML pipeline entirely
+SILENCE_ENERGY_FLOOR = 1e-5
+MIN_SPEECH_SAMPLES = SAMPLE_RATE // 4
+
+# Background-listen recognition workers. Each blocks on its batched segment,
+# so this is also the most segments a VAD batch can ever hold
+BG_RECOGNITION_WORKERS = min(4, os.cpu_count() or 1)
+
+# Background phrases arriving within this window are VAD-scored as one batch
+# (a batch is flushed sooner once no other recognition can still join it)
+VAD_BATCH_WINDOW = 0.02  # seconds
+
+# After a failed microphone probe, report "absent" without re-probing for this long
+MIC_REPROBE_INTERVAL = 60  # seconds
+
 
 class STTManager:
     """
@@ -28,6 +55,18 @@ class STTManager:
     - Confidence filtering
     """
     
+    # Language name -> speech recognition language code (default: en-IN)
+    _LANG_MAP = {
+        # Use hi-IN for Hindi/Hinglish - better recognition for Indian accent
+        "hinglish": "hi-IN",
+        "hindi": "hi-IN",
+        "marathi": "mr-IN",
+        # For English mode, use en-US which has better general recognition
+        # en-IN has issues with Indian English accents sometimes
+        "english": "en-US",
+        "en": "en-US"
+    }
+    
     def __init__(self, use_advanced: bool = True):
         """
         Initialize speech recognition
@@ -39,6 +78,10 @@ class STTManager:
         self.microphone = None
         self.enabled = True
         
+        # Microphone probe result: "unknown" | "ok" | "absent"
+        self._mic_state = "unknown"
+        self._mic_probe_time = 0.0
+        
         # PHASE 1: Advanced audio processor
         self.use_advanced = use_advanced and ADVANCED_PROCESSOR_AVAILABLE
         self.advanced_processor = None
@@ -68,8 +111,35 @@ class STTManager:
             print("✅ STT Manager initialized with standard Google SR")
             self._setup_standard_recognizer()
         
-        # Adjust for ambient noise on first use
-        self._calibrated = False
+        # Ambient noise calibration runs in the background once the microphone
+        # is first opened; the lock serializes access to the PyAudio stream
+        self._calibrated = threading.Event()
+        self._mic_lock = threading.Lock()
+        
+        # Dedicated high-priority thread for advanced-pipeline inference, fed
+        # through a small bounded queue so capture threads never run the ML models
+        self._infer_q = queue.Queue(maxsize=4)
+        self._infer_thread = None
+        if self.use_advanced:
+            self._infer_thread = threading.Thread(
+                target=self._infer_worker, name="stt-infer", daemon=True
+            )
+            self._infer_thread.start()
+        
+        # Worker pool for background-listen recognition (created on first use)
+        self._bg_executor = None
+        
+        # Background segments waiting to be batched through the advanced pipeline
+        self._pending = []  # [(audio_np, lang_code, future)]
+        self._pending_lock = threading.Lock()
+        self._batch_timer = None
+        # Background recognitions in flight that haven't queued a segment yet
+        self._unbatched = 0
+        self._batch_state = threading.local()
+        
+        # Pooled float32 staging buffers for PCM normalization
+        self._f32_pool = pcm_utils.Float32BufferPool()
+        self._f32_pool.release(self._f32_pool.acquire(DEFAULT_PHRASE_TIME_LIMIT * SAMPLE_RATE))
     
     def _setup_standard_recognizer(self):
         """Setup standard Google SR with balanced settings for ACCURACY + SPEED"""
@@ -93,26 +163,86 @@ class STTManager:
     
     def _ensure_microphone(self) -> bool:
         """Ensure microphone is available"""
-        if self.microphone is None:
-            try:
+        if self._mic_state == "ok":
+            return True
+        
+        # Skip the PyAudio probe entirely while a recent one said there's no mic
+        if (self._mic_state == "absent" and
+                time.monotonic() - self._mic_probe_time < MIC_REPROBE_INTERVAL):
+            return False
+        
+        self._mic_probe_time = time.monotonic()
+        try:
+            # Capture at the pipeline rate so frames need no conversion downstream;
+            # devices that reject it keep their default rate (get_raw_data converts)
+            if self._input_supports_rate(SAMPLE_RATE):
+                self.microphone = sr.Microphone(sample_rate=SAMPLE_RATE)
+            else:
                 self.microphone = sr.Microphone()
-                print("🎤 Microphone ready")
-                return True
-            except Exception as e:
-                # Only print error once, not repeatedly
-                if not hasattr(self, '_mic_error_shown'):
-                    print(f"⚠️ No microphone detected - API mode only")
-                    self._mic_error_shown = True
-                return False
+        except Exception:
+            # Only print error once, not on every re-probe
+            if self._mic_state == "unknown":
+                print(f"⚠️ No microphone detected - API mode only")
+            self._mic_state = "absent"
+            return False
+        
+        self._mic_state = "ok"
+        print("🎤 Microphone ready")
+        # Calibrate off the listen critical path
+        threading.Thread(target=self._calibrate_noise, daemon=True).start()
         return True
     
+    @staticmethod
+    def _input_supports_rate(rate: int) -> bool:
+        """
+        Check whether the default input device can capture 16-bit mono at a rate
+        
+        sr.Microphone doesn't open the device until it's entered, so an
+        unsupported rate would otherwise only fail on the first listen.
+        
+        Args:
+            rate: Sample rate in Hz
+        
+        Returns:
+            True if PyAudio reports the format as supported
+        """
+        pyaudio = sr.Microphone.get_pyaudio()
+        audio = pyaudio.PyAudio()
+        try:
+            device = audio.get_default_input_device_info()
+            return audio.is_format_supported(
+                rate,
+                input_device=device["index"],
+                input_channels=1,
+                input_format=pyaudio.paInt16,
+            )
+        except ValueError:
+            # is_format_supported raises rather than returning False
+            return False
+        finally:
+            audio.terminate()
+    
+    def prepare_microphone(self) -> bool:
+        """
+        Open the microphone ahead of the first listen
+        
+        Also starts background noise calibration, so the first utterance
+        doesn't wait for it.
+        
+        Returns:
+            True if a microphone is available
+        """
+        return self.enabled and self._ensure_microphone()
+    
     def _calibrate_noise(self):
         """Calibrate for ambient noise (one-time on first use) - FAST"""
-        if self._calibrated or not self._ensure_microphone():
+        if self._calibrated.is_set() or not self._ensure_microphone():
             return
         
         try:
-            with self.microphone as source:
+            with self._mic_lock, self.microphone as source:
+                if self._calibrated.is_set():
+                    return
                 # Quick calibration - 0.3 seconds for better accuracy
                 self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
                 # Lower threshold for faster detection (but not too low to avoid noise)
@@ -121,12 +251,12 @@ class STTManager:
                 self.recognizer.dynamic_energy_threshold = True
                 self.recognizer.dynamic_energy_adjustment_damping = 0.15
                 self.recognizer.dynamic_energy_ratio = 1.5
-            self._calibrated = True
+            self._calibrated.set()
             print(f"Microphone ready (threshold: {self.recognizer.energy_threshold:.0f})")
         except Exception as e:
             print(f"Calibration warning: {e}")
     
-    def listen(self, timeout: int = 20, phrase_time_limit: Optional[int] = None,
+    def listen(self, timeout: float = 20, phrase_time_limit: Optional[float] = None,
                language: str = "en-US") -> Tuple[bool, str]:
         """
         Listen for speech input with PHASE 1 ML-grade processing
@@ -152,27 +282,24 @@ class STTManager:
         if not self._ensure_microphone():
             return False, "Microphone not available"
         
-        # Calibrate on first use
-        self._calibrate_noise()
-        
         try:
-            # Capture audio from microphone
-            with self.microphone as source:
+            # Capture audio from microphone. Calibration holds _mic_lock for its
+            # whole 0.3 s sample, so a listen that arrives mid-calibration waits
+            # for it to finish (once; prepare_microphone normally starts it
+            # early enough). One that hasn't begun yet runs after this phrase,
+            # and dynamic_energy_threshold adapts in the meantime.
+            with self._mic_lock, self.microphone as source:
                 # NO ambient adjustment during listen - already calibrated!
                 # This saves 0.2 seconds per request
                 
                 audio = self.recognizer.listen(
                     source,
                     timeout=timeout,
-                    phrase_time_limit=phrase_time_limit or 6  # Balanced: complete messages but faster
+                    phrase_time_limit=phrase_time_limit or DEFAULT_PHRASE_TIME_LIMIT  # Balanced: complete messages but faster
                 )
             
-            # PHASE 1: Use advanced ML processing if available
-            if self.use_advanced and self.advanced_processor:
-                return self._process_with_advanced(audio, language)
-            else:
-                # Fallback: Standard Google SR
-                return self._process_with_google_sr(audio, language)
+            # PHASE 1: Use advanced ML processing if available, else standard Google SR
+            return self._recognize(audio, language)
         
         except sr.WaitTimeoutError:
             return False, "TIMEOUT"  # Silent - just return code
@@ -183,34 +310,54 @@ class STTManager:
         except Exception as e:
             return False, f"STT_ERROR"  # Silent - just return code
     
-    def _process_with_advanced(self, audio: sr.AudioData, language: str) -> Tuple[bool, str]:
+    def _process_with_advanced(self, audio: sr.AudioData, language: str,
+                               batched: bool = False) -> Tuple[bool, str]:
         """
         Process audio with PHASE 1 advanced ML pipeline
         
         Args:
             audio: Captured audio data
             language: Language code
+            batched: Coalesce with other concurrent segments for batched VAD
         
         Returns:
             (success, text or error)
         """
+        # Raw PCM is already 16 kHz int16 in the common case - read it directly
+        # and only pay get_raw_data()'s conversion once, at the edge, otherwise
+        if audio.sample_width == 2 and audio.sample_rate == SAMPLE_RATE:
+            raw = audio.frame_data
+        else:
+            raw = audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+        pcm = np.frombuffer(raw, dtype=np.int16)
+        buf = self._f32_pool.acquire(pcm.size)
+        
         try:
             print("🚀 Processing with PHASE 1 ML pipeline...")
             
-            # Convert audio to numpy array (16kHz, mono)
-            audio_np = np.frombuffer(audio.get_raw_data(), dtype=np.int16).astype(np.float32)
-            audio_np = audio_np / 32768.0  # Normalize to [-1, 1]
+            # Convert audio to numpy array (16kHz, mono), normalized to [-1, 1]
+            audio_np = pcm_utils.normalize_int16(pcm, buf)
+            
+            # Skip RNNoise + VAD for obvious silence / too-short captures
+            # (np.dot is a single BLAS pass with no temporary array)
+            if (audio_np.size < MIN_SPEECH_SAMPLES or
+                    float(np.dot(audio_np, audio_np)) / audio_np.size < SILENCE_ENERGY_FLOOR):
+                return False, "TIMEOUT"
             
             # Convert language code to simple format for Whisper
             lang_code = "en" if "en" in language else "hi"
             
             # Process through advanced pipeline
             # Pipeline: RNNoise → VAD → Enhanced Google SR → Confidence Filter
-            text, metadata = self.advanced_processor.process_audio(
-                audio_np,
-                language=lang_code,
-                skip_vad=False  # Use VAD to filter noise
-            )
+            if batched:
+                text, metadata = self._submit_for_batch(audio_np, lang_code).result()
+            else:
+                text, metadata = self._run_inference(
+                    self.advanced_processor.process_audio,
+                    audio_np,
+                    language=lang_code,
+                    skip_vad=False  # Use VAD to filter noise
+                )
             
             # Check results
             if text and len(text.strip()) > 0:
@@ -245,6 +392,120 @@ class STTManager:
             # Fallback to Google SR
             print("   🔄 Falling back to Google SR...")
             return self._process_with_google_sr(audio, language)
+        
+        finally:
+            self._f32_pool.release(buf)
+    
+    def _run_inference(self, fn, *args, **kwargs):
+        """Run fn on the inference thread and wait for its result"""
+        if self._infer_thread is None:
+            return fn(*args, **kwargs)
+        
+        future = Future()
+        self._infer_q.put((fn, args, kwargs, future))
+        return future.result()
+    
+    def _infer_worker(self):
+        """Inference thread loop: run queued pipeline calls one at a time"""
+        self._raise_thread_priority()
+        
+        while True:
+            fn, args, kwargs, future = self._infer_q.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+    
+    @staticmethod
+    def _raise_thread_priority():
+        """Best-effort bump of the calling thread's scheduling priority"""
+        try:
+            if sys.platform.startswith("linux"):
+                # pid 0 = calling thread; needs CAP_SYS_NICE, so usually a no-op
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            elif sys.platform == "win32":
+                THREAD_PRIORITY_TIME_CRITICAL = 15
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL)
+        except (OSError, AttributeError):
+            pass  # Not permitted here - run at normal priority
+    
+    def _submit_for_batch(self, audio_np: np.ndarray, lang_code: str) -> Future:
+        """
+        Queue a segment for the next batched advanced-pipeline run
+        
+        The batch is flushed as soon as no other background recognition can
+        still join it (every worker's segment is queued, or nothing else is
+        in flight), and otherwise VAD_BATCH_WINDOW seconds after the first
+        segment arrived.
+        
+        Returns:
+            Future resolving to (text, metadata)
+        """
+        future = Future()
+        with self._pending_lock:
+            self._pending.append((audio_np, lang_code, future))
+            if getattr(self._batch_state, 'counted', False):
+                self._batch_state.counted = False
+                self._unbatched -= 1
+            if len(self._pending) >= BG_RECOGNITION_WORKERS or self._unbatched <= 0:
+                flush_now = True
+            else:
+                flush_now = False
+                if self._batch_timer is None:
+                    self._batch_timer = threading.Timer(VAD_BATCH_WINDOW, self._flush_batch)
+                    self._batch_timer.daemon = True
+                    self._batch_timer.start()
+        
+        if flush_now:
+            self._flush_batch()
+        return future
+    
+    def _recognize_background(self, audio: sr.AudioData, language: str) -> Tuple[bool, str]:
+        """
+        Background-listen worker: batched _recognize that keeps the count of
+        recognitions which may still join the pending VAD batch
+        """
+        self._batch_state.counted = True
+        try:
+            return self._recognize(audio, language, batched=True)
+        finally:
+            if self._batch_state.counted:
+                # Finished without queuing a segment (silence, or the
+                # Google SR path): stop holding back the pending batch
+                self._batch_state.counted = False
+                with self._pending_lock:
+                    self._unbatched -= 1
+                    flush_now = bool(self._pending) and self._unbatched <= 0
+                if flush_now:
+                    self._flush_batch()
+    
+    def _flush_batch(self):
+        """Run all pending segments through process_audio_batch, grouped by language"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+        
+        by_language = {}
+        for item in pending:
+            by_language.setdefault(item[1], []).append(item)
+        
+        for lang_code, items in by_language.items():
+            try:
+                results = self._run_inference(
+                    self.advanced_processor.process_audio_batch,
+                    [audio_np for audio_np, _, _ in items],
+                    language=lang_code
+                )
+                for (_, _, future), result in zip(items, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, _, future in items:
+                    future.set_exception(e)
     
     def _process_with_google_sr(self, audio: sr.AudioData, language: str) -> Tuple[bool, str]:
         """
@@ -280,6 +541,10 @@ class STTManager:
         """
         Listen continuously in background (advanced feature)
         
+        Recognition runs on a small worker pool so back-to-back phrases are
+        transcribed in parallel; callback may therefore be invoked from
+        several worker threads.
+        
         Args:
             callback: Function to call with recognized text
             language: Language code
@@ -293,14 +558,30 @@ class STTManager:
         # Calibrate first
         self._calibrate_noise()
         
-        def recognize_callback(recognizer, audio):
+        if self._bg_executor is None:
+            self._bg_executor = ThreadPoolExecutor(
+                max_workers=BG_RECOGNITION_WORKERS,
+                thread_name_prefix="stt-bg"
+            )
+        
+        def deliver(future: Future):
             try:
-                text = recognizer.recognize_google(audio, language=language)
-                callback(text)
-            except sr.UnknownValueError:
-                pass  # Ignore unintelligible audio
-            except sr.RequestError as e:
+                success, text = future.result()
+            except Exception as e:
                 print(f"❌ Recognition error: {e}")
+                return
+            if success:
+                callback(text)
+        
+        def recognize_callback(recognizer, audio):
+            # Hand off immediately so the capture thread can keep listening.
+            # Counted from submission, so a batch also waits for phrases
+            # still queued behind busy workers
+            with self._pending_lock:
+                self._unbatched += 1
+            self._bg_executor.submit(
+                self._recognize_background, audio, language
+            ).add_done_callback(deliver)
         
         # Start background listening
         stop_listening = self.recognizer.listen_in_background(
@@ -311,6 +592,13 @@ class STTManager:
         print("🎤 Background listening started")
         return stop_listening
     
+    def _recognize(self, audio: sr.AudioData, language: str,
+                   batched: bool = False) -> Tuple[bool, str]:
+        """Transcribe captured audio with the advanced pipeline or Google SR"""
+        if self.use_advanced and self.advanced_processor:
+            return self._process_with_advanced(audio, language, batched=batched)
+        return self._process_with_google_sr(audio, language)
+    
     def get_language_code(self, language: str) -> str:
         """
         Convert language name to speech recognition language code
@@ -321,21 +609,8 @@ class STTManager:
         Returns:
             Language code for speech recognition
         """
-        language_lower = language.lower()
-        
-        # Use appropriate language code for better recognition
-        if language_lower in ["hinglish", "hindi"]:
-            # Use hi-IN for Hindi/Hinglish - better recognition for Indian accent
-            return "hi-IN"
-        elif language_lower == "marathi":
-            return "mr-IN"
-        elif language_lower in ["english", "en"]:
-            # For English mode, use en-US which has better general recognition
-            # en-IN has issues with Indian English accents sometimes
-            return "en-US"
-        else:
-            # Default to en-IN for other cases
-            return "en-IN"
+        # Already-lowercase names (the common case) skip the lower() allocation
+        return self._LANG_MAP.get(language if language.islower() else language.lower(), "en-IN")
     
     def enable(self):
         """Enable STT"""
@@ -362,7 +637,7 @@ class STTManager:
             return False
         
         try:
-            with self.microphone as source:
+            with self._mic_lock, self.microphone as source:
                 print("🎤 Testing microphone... Say something!")
                 audio = self.recognizer.listen(source, timeout=2, phrase_time_limit=6)  # Fast but complete
                 text = self.recognizer.recognize_google(audio)
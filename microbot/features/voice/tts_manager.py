@@ -4,14 +4,97 @@ Supports multiple voices: Matthew, Justin, Salli (English), Aditi (Hinglish)
 """
 
 import boto3
+from botocore.config import Config
+from collections import OrderedDict
 from contextlib import closing
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
 import io
+import queue
+import threading
+import time
 import sounddevice as sd
 import numpy as np
 from pydub import AudioSegment
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
 import os
 
+from . import pcm_utils
+
+try:
+    # In-process MP3 decoder - avoids spawning ffmpeg for every utterance
+    import miniaudio
+    MINIAUDIO_AVAILABLE = True
+except ImportError:
+    MINIAUDIO_AVAILABLE = False
+
+
+# Rate requested from Polly. Polly only produces raw PCM at 8/16 kHz, so
+# 16 kHz works for both formats; audio is resampled once to the device rate.
+POLLY_SAMPLE_RATE = 16000
+
+# Decoded-audio cache limits for repeated phrases (entry count and total bytes)
+AUDIO_CACHE_MAX_ENTRIES = 128
+AUDIO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# On-disk cache: total size cap (least recently used files go first) and the
+# longest text persisted outside prefetch, so one-off replies aren't kept
+DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DISK_CACHE_MAX_TEXT_CHARS = 80
+
+# Polly client timeouts (seconds); TCP keepalive stops idle connections from going stale
+POLLY_CONNECT_TIMEOUT = 10
+POLLY_READ_TIMEOUT = 5
+
+# Bytes read from the Polly audio stream per chunk (128 ms of 16 kHz PCM)
+STREAM_CHUNK_BYTES = 4096
+
+
+# boto3 sessions and Polly clients shared across TTSManager instances, so
+# re-creating the manager (voice mode toggles, reconfiguration) reuses the
+# resolved credentials, endpoint data and warm connection pool
+_session_cache: Dict[tuple, boto3.Session] = {}
+_client_cache: Dict[tuple, Any] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _polly_client(region: str, access_key: str, secret_key: str,
+                  connect_timeout: float, read_timeout: float):
+    """Return a cached Polly client for these credentials and timeouts"""
+    session_key = (region, access_key, secret_key)
+    client_key = session_key + (connect_timeout, read_timeout)
+    with _client_cache_lock:
+        client = _client_cache.get(client_key)
+        if client is None:
+            session = _session_cache.get(session_key)
+            if session is None:
+                session = boto3.Session(
+                    region_name=region,
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key
+                )
+                _session_cache[session_key] = session
+            client = session.client(
+                'polly',
+                config=Config(
+                    max_pool_connections=4,
+                    tcp_keepalive=True,
+                    connect_timeout=connect_timeout,
+                    read_timeout=read_timeout,
+                    retries={'max_attempts': 2, 'mode': 'standard'}
+                )
+            )
+            _client_cache[client_key] = client
+        return client
+
+
+class _NullQueue:
+    """Stand-in chunk queue for cache-only synthesis"""
+    
+    def put(self, item):
+        pass
+
 
 class TTSManager:
     """AWS Polly Text-to-Speech Manager"""
@@ -48,9 +131,22 @@ class TTSManager:
         }
     }
     
+    # SSML wrapper and single-pass escape table for synthesis requests
+    _SSML_TEMPLATE = '<speak><prosody pitch="{pitch}" rate="{rate}" volume="{volume}">{text}</prosody></speak>'
+    _SSML_ESCAPE = str.maketrans({
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&apos;"
+    })
+    
     def __init__(self, aws_region: str = "ap-south-1", 
                  aws_access_key: Optional[str] = None,
-                 aws_secret_key: Optional[str] = None):
+                 aws_secret_key: Optional[str] = None,
+                 connect_timeout: float = POLLY_CONNECT_TIMEOUT,
+                 read_timeout: float = POLLY_READ_TIMEOUT,
+                 cache_dir: Optional[str] = None):
         """
         Initialize AWS Polly TTS
         
@@ -58,6 +154,9 @@ class TTSManager:
             aws_region: AWS region (default: ap-south-1 for India)
             aws_access_key: AWS access key (or use env MICROBOT_AWS_ACCESS_KEY or AWS_ACCESS_KEY_ID)
             aws_secret_key: AWS secret key (or use env MICROBOT_AWS_SECRET_KEY or AWS_SECRET_ACCESS_KEY)
+            connect_timeout: Seconds to wait for a Polly connection
+            read_timeout: Seconds to wait for each read from the audio stream
+            cache_dir: Directory for the on-disk audio cache (disabled if None)
         """
         # Get credentials from parameters or environment variables
         # Try multiple env var names for compatibility
@@ -82,11 +181,9 @@ class TTSManager:
             )
         
         try:
-            self.polly = boto3.client(
-                'polly',
-                region_name=aws_region,
-                aws_access_key_id=self.aws_access_key,
-                aws_secret_access_key=self.aws_secret_key
+            self.polly = _polly_client(
+                aws_region, self.aws_access_key, self.aws_secret_key,
+                connect_timeout, read_timeout
             )
             print("✅ AWS Polly TTS initialized successfully")
         except Exception as e:
@@ -95,6 +192,49 @@ class TTSManager:
         
         self.current_voice = "justin"  # Default voice (young, energetic)
         self.enabled = True
+        
+        # Raw 16-bit PCM skips MP3 decoding entirely; set to "mp3" to use the
+        # pydub/ffmpeg path instead
+        self._format = "pcm"
+        
+        # Polly round-trips + MP3 decode run on worker threads so the next
+        # utterance can be fetched while the current one is still playing.
+        # Playback stays on a single worker to keep utterances in order.
+        self._synth_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-synth")
+        self._play_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-play")
+        
+        # Open the TLS connection now so the first synthesize doesn't pay the handshake
+        self._synth_executor.submit(self._prewarm_connection)
+        
+        # Persistent output stream, opened on first playback and kept open so
+        # each utterance doesn't pay PortAudio device open/close
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        self._device_sr = None  # Output device native rate, queried on first use
+        
+        # LRU of decoded float32 audio for repeated phrases, keyed by SHA-1 of the request
+        self._audio_cache = OrderedDict()
+        self._audio_cache_bytes = 0
+        self._audio_cache_lock = threading.Lock()
+        
+        # Raw Polly audio persisted across runs so repeated phrases skip the network
+        self._cache_dir = None
+        self._disk_cache_bytes = 0
+        self._disk_cache_lock = threading.Lock()
+        if cache_dir:
+            try:
+                Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                self._cache_dir = Path(cache_dir)
+                self._disk_cache_bytes = sum(size for _, _, size in self._disk_cache_files())
+            except OSError as e:
+                print(f"⚠️ TTS disk cache disabled: {e}")
+    
+    def _prewarm_connection(self):
+        """Make a cheap Polly call to populate the connection pool"""
+        try:
+            self.polly.describe_voices(LanguageCode='en-US')
+        except Exception:
+            pass  # Best effort - synthesize will connect on demand
     
     def set_voice(self, voice_name: str) -> bool:
         """
@@ -130,6 +270,20 @@ class TTSManager:
         else:
             return self.current_voice if self.current_voice != "aditi" else "justin"
     
+    def apply_voice_for_language(self, language: str) -> Dict[str, Any]:
+        """
+        Switch to the appropriate voice for a language
+        
+        Args:
+            language: Language code (english, hinglish, marathi)
+        
+        Returns:
+            Config dict of the voice now in use
+        """
+        voice = self.get_voice_for_language(language)
+        self.current_voice = voice
+        return self.VOICES[voice]
+    
     def synthesize(self, text: str, voice_name: Optional[str] = None,
                    pitch: str = "+0%", rate: str = "125%", volume: str = "medium") -> Optional[bytes]:
         """
@@ -143,11 +297,31 @@ class TTSManager:
             volume: Volume level (soft, medium, loud, x-loud)
         
         Returns:
-            Audio data (MP3 bytes) or None on error
+            Audio data (16-bit mono PCM, or MP3 bytes in mp3 mode) or None on error
         """
         if not self.enabled:
             return None
         
+        stream = self._request_speech(*self._build_request(text, voice_name, pitch, rate, volume))
+        if stream is None:
+            return None
+        
+        try:
+            with closing(stream):
+                return stream.read()
+        except Exception as e:
+            print(f"❌ TTS Error: {e}")
+            return None
+    
+    def _build_request(self, text: str, voice_name: Optional[str] = None,
+                       pitch: str = "+0%", rate: str = "125%",
+                       volume: str = "medium") -> Tuple[Dict[str, Any], str]:
+        """
+        Resolve the voice and build the SSML for a synthesis request
+        
+        Returns:
+            (voice_config, ssml)
+        """
         # Use specified voice or current voice
         voice = voice_name or self.current_voice
         
@@ -158,37 +332,41 @@ class TTSManager:
         voice_config = self.VOICES[voice]
         
         # Build SSML with prosody control
-        ssml = '<speak>'
-        ssml += f'<prosody pitch="{pitch}" rate="{rate}" volume="{volume}">'
-        ssml += self._escape_ssml(text)
-        ssml += '</prosody>'
-        ssml += '</speak>'
+        ssml = self._SSML_TEMPLATE.format(
+            pitch=pitch, rate=rate, volume=volume, text=self._escape_ssml(text)
+        )
         
+        return voice_config, ssml
+    
+    def _request_speech(self, voice_config: Dict[str, Any], ssml: str):
+        """
+        Call Polly and return the (unread) audio stream
+        
+        Returns:
+            Streaming body with PCM/MP3 audio, or None on error
+        """
         try:
             response = self.polly.synthesize_speech(
                 Text=ssml,
                 TextType='ssml',
-                OutputFormat='mp3',
+                OutputFormat=self._format,
+                SampleRate=str(POLLY_SAMPLE_RATE),  # Same rate for every voice/format
                 VoiceId=voice_config['voice_id'],
                 Engine=voice_config['engine']
             )
             
-            if "AudioStream" in response:
-                with closing(response["AudioStream"]) as stream:
-                    return stream.read()
+            return response.get("AudioStream")
         
         except Exception as e:
             print(f"❌ TTS Error: {e}")
             return None
-        
-        return None
     
     def play_audio(self, audio_data: bytes) -> bool:
         """
         Play audio through speakers
         
         Args:
-            audio_data: MP3 audio bytes
+            audio_data: Audio bytes from synthesize()
         
         Returns:
             True if played successfully, False otherwise
@@ -197,33 +375,414 @@ class TTSManager:
             return False
         
         try:
-            audio = AudioSegment.from_mp3(io.BytesIO(audio_data))
+            decoded = self._decode(io.BytesIO(audio_data))
+        except Exception as e:
+            print(f"❌ Audio playback error: {e}")
+            return False
+        
+        return self._play_samples(*decoded)
+    
+    def _decode(self, audio_file) -> Tuple[np.ndarray, int]:
+        """
+        Decode Polly output into float32 samples ready for sounddevice
+        
+        Args:
+            audio_file: File-like object with audio in the current output format
+        
+        Returns:
+            (samples, frame_rate)
+        """
+        if self._format != "pcm":
+            return self._decode_mp3(audio_file)
+        
+        pcm = np.frombuffer(audio_file.read(), dtype=np.int16)
+        samples = pcm_utils.normalize_int16(pcm, np.empty(pcm.size, dtype=np.float32))
+        return samples, POLLY_SAMPLE_RATE
+    
+    def _decode_mp3(self, mp3_file) -> Tuple[np.ndarray, int]:
+        """
+        Decode MP3 into float32 samples ready for sounddevice
+        
+        Args:
+            mp3_file: File-like object with MP3 data
+        
+        Returns:
+            (samples, frame_rate)
+        """
+        if MINIAUDIO_AVAILABLE:
+            # Decodes straight to normalized mono float32 at the device rate
+            device_sr = self._device_rate()
+            decoded = miniaudio.decode(
+                mp3_file.read(),
+                output_format=miniaudio.SampleFormat.FLOAT32,
+                nchannels=1,
+                sample_rate=device_sr
+            )
+            return np.frombuffer(decoded.samples, dtype=np.float32), device_sr
+        
+        # Fallback: pydub (spawns ffmpeg)
+        audio = AudioSegment.from_mp3(mp3_file)
+        
+        # ULTRA FAST: No silence added for instant response
+        # silence = AudioSegment.silent(duration=100)
+        # audio = audio + silence
+        
+        # Output stream is mono 16-bit; pydub downmixes in C if needed
+        if audio.channels != 1:
+            audio = audio.set_channels(1)
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+        
+        # Alias the decoded bytes (no array.array copy) and normalize in one pass
+        pcm = np.frombuffer(audio.raw_data, dtype=np.int16)
+        samples = pcm_utils.normalize_int16(pcm, np.empty(pcm.size, dtype=np.float32))
+        
+        return samples, audio.frame_rate
+    
+    def _device_rate(self) -> int:
+        """Native sample rate of the default output device (cached)"""
+        if self._device_sr is None:
+            try:
+                self._device_sr = int(sd.query_devices(kind='output')['default_samplerate'])
+            except Exception:
+                self._device_sr = POLLY_SAMPLE_RATE
+        return self._device_sr
+    
+    def _to_device_rate(self, samples: np.ndarray, frame_rate: int) -> Tuple[np.ndarray, int]:
+        """
+        Resample to the output device rate in a single polyphase pass
+        
+        Doing this once up front keeps PortAudio from resampling (or the
+        stream from reopening) for every utterance.
+        """
+        device_sr = self._device_rate()
+        if frame_rate == device_sr:
+            return samples, frame_rate
+        
+        from scipy.signal import resample_poly
+        resampled = resample_poly(samples, device_sr, frame_rate).astype(np.float32, copy=False)
+        return resampled, device_sr
+    
+    def _get_stream(self) -> sd.OutputStream:
+        """Open (once) and return the persistent output stream, resuming it if paused"""
+        if self._stream is None:
+            self._stream = sd.OutputStream(
+                samplerate=self._device_rate(),
+                channels=1,
+                dtype='float32',
+                blocksize=1024
+            )
+        if self._stream.stopped:
+            self._stream.start()
+        return self._stream
+    
+    def pause_stream(self):
+        """
+        Stop the output stream without closing it
+        
+        Lets the device idle while voice mode is off; the next playback
+        restarts the same stream instead of reopening the device.
+        """
+        with self._stream_lock:
+            if self._stream is not None and not self._stream.stopped:
+                try:
+                    self._stream.stop()  # Drains queued audio first
+                except Exception as e:
+                    print(f"⚠️ Could not pause audio stream: {e}")
+    
+    @staticmethod
+    def _wait_for_drain(stream: sd.OutputStream):
+        """
+        Block until audio already written to the stream has been played
+        
+        A blocking write returns once the last block fits in PortAudio's
+        buffer, which still holds up to one output latency (plus the block
+        being played) of audio. The stream stays open, so wait that out
+        instead of stopping it.
+        """
+        time.sleep(stream.latency + stream.blocksize / stream.samplerate)
+    
+    def _play_samples(self, samples: np.ndarray, frame_rate: int) -> bool:
+        """Play decoded samples and block until playback completes"""
+        try:
+            samples, frame_rate = self._to_device_rate(samples, frame_rate)
+            
+            with self._stream_lock:
+                # Blocking write - returns once the utterance is queued on the device
+                stream = self._get_stream()
+                stream.write(np.ascontiguousarray(samples, dtype=np.float32))
             
-            # ULTRA FAST: No silence added for instant response
-            # silence = AudioSegment.silent(duration=100)
-            # audio = audio + silence
+            # Return only once the queued tail has actually been heard
+            self._wait_for_drain(stream)
             
-            samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
+            return True
+        
+        except Exception as e:
+            print(f"❌ Audio playback error: {e}")
+            return False
+    
+    def _prepare(self, chunks: Optional[queue.Queue], text: str,
+                 voice_name: Optional[str] = None, **kwargs):
+        """
+        Synthesize speech and feed device-rate chunks to the player
+        (runs on the synth worker pool)
+        
+        Args:
+            chunks: Queue receiving float32 sample chunks, then None when done
+                    (None to only populate the caches)
+            text: Text to speak
+            voice_name: Override voice (optional)
+        """
+        # Prefetched phrases are chosen to be reused; otherwise only short ones
+        # (greetings, acknowledgements) are worth keeping across runs
+        persist = chunks is None or len(text) <= DISK_CACHE_MAX_TEXT_CHARS
+        if chunks is None:
+            chunks = _NullQueue()
+        
+        try:
+            voice_config, ssml = self._build_request(text, voice_name, **kwargs)
+            key = hashlib.sha1(
+                f"{voice_config['voice_id']}|{voice_config['engine']}|{self._format}|{ssml}".encode("utf-8")
+            ).digest()
             
-            # Handle stereo
-            if audio.channels == 2:
-                samples = samples.reshape((-1, 2))
+            cached = self._cache_get(key)
+            if cached is None:
+                cached = self._disk_cache_get(key)
+                if cached is not None:
+                    self._cache_put(key, cached)
+            if cached is not None:
+                chunks.put(cached[0])
+                return
             
-            # Normalize
-            samples = samples / (2**15)
+            stream = self._request_speech(voice_config, ssml)
+            if stream is None:
+                return
             
-            # Play
-            sd.play(samples, audio.frame_rate)
-            sd.wait()  # Wait for playback to complete
+            with closing(stream):
+                if self._format == "pcm":
+                    decoded, raw = self._stream_pcm(stream, chunks)
+                else:
+                    # MP3 can't be decoded incrementally here - play it whole
+                    raw = stream.read()
+                    decoded = self._to_device_rate(*self._decode(io.BytesIO(raw)))
+                    chunks.put(decoded[0])
             
-            # No extra sleep needed - removed 0.2s delay for faster response
+            self._cache_put(key, decoded)
+            if persist:
+                self._disk_cache_put(key, raw)
+        except Exception as e:
+            print(f"❌ Audio decode error: {e}")
+        finally:
+            chunks.put(None)
+    
+    def _stream_pcm(self, stream, chunks: queue.Queue) -> Tuple[Tuple[np.ndarray, int], bytes]:
+        """
+        Decode the Polly PCM stream chunk by chunk as it downloads
+        
+        Playback starts on the first chunk instead of after the whole
+        utterance has been generated.
+        
+        Returns:
+            ((samples, frame_rate) at the device rate, raw PCM bytes)
+        """
+        device_sr = self._device_rate()
+        resampler = None
+        if device_sr != POLLY_SAMPLE_RATE:
+            resampler = pcm_utils.LinearResampler(POLLY_SAMPLE_RATE, device_sr)
+        
+        parts = []
+        raw = bytearray()
+        carry = b""  # Odd trailing byte of a 16-bit sample split across chunks
+        for data in stream.iter_chunks(chunk_size=STREAM_CHUNK_BYTES):
+            if carry:
+                data = carry + data
+            usable = len(data) & ~1
+            carry = data[usable:]
+            if not usable:
+                continue
+            raw += data[:usable]
             
-            return True
+            pcm = np.frombuffer(data, dtype=np.int16, count=usable // 2)
+            samples = pcm_utils.normalize_int16(pcm, np.empty(pcm.size, dtype=np.float32))
+            if resampler is not None:
+                samples = resampler.process(samples)
+            if samples.size:
+                chunks.put(samples)
+                parts.append(samples)
         
+        if not parts:
+            return (np.empty(0, dtype=np.float32), device_sr), bytes(raw)
+        return (np.concatenate(parts), device_sr), bytes(raw)
+    
+    def _cache_get(self, key: bytes) -> Optional[Tuple[np.ndarray, int]]:
+        """Look up decoded audio and mark it most recently used"""
+        with self._audio_cache_lock:
+            entry = self._audio_cache.get(key)
+            if entry is not None:
+                self._audio_cache.move_to_end(key)
+            return entry
+    
+    def _cache_put(self, key: bytes, decoded: Tuple[np.ndarray, int]):
+        """Store decoded audio, evicting least recently used entries over the caps"""
+        samples = decoded[0]
+        if samples.nbytes > AUDIO_CACHE_MAX_BYTES:
+            return
+        samples.flags.writeable = False  # Shared between plays - never mutate
+        
+        with self._audio_cache_lock:
+            if key in self._audio_cache:
+                return
+            self._audio_cache[key] = decoded
+            self._audio_cache_bytes += samples.nbytes
+            while (len(self._audio_cache) > AUDIO_CACHE_MAX_ENTRIES
+                   or self._audio_cache_bytes > AUDIO_CACHE_MAX_BYTES):
+                _, (evicted, _) = self._audio_cache.popitem(last=False)
+                self._audio_cache_bytes -= evicted.nbytes
+    
+    def _disk_cache_path(self, key: bytes) -> Path:
+        """File holding the raw Polly audio for a request key"""
+        return self._cache_dir / f"{key.hex()}.{self._format}"
+    
+    def _disk_cache_get(self, key: bytes) -> Optional[Tuple[np.ndarray, int]]:
+        """Load and decode cached audio from disk, if present"""
+        if self._cache_dir is None:
+            return None
+        path = self._disk_cache_path(key)
+        try:
+            with open(path, "rb") as f:
+                decoded = self._to_device_rate(*self._decode(f))
+            # mtime tracks last use for eviction
+            os.utime(path)
+            return decoded
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ TTS disk cache read failed: {e}")
+            return None
+    
+    def _disk_cache_put(self, key: bytes, raw: bytes):
+        """Persist raw Polly audio atomically (write to temp file, then rename)"""
+        if self._cache_dir is None or not raw:
+            return
+        path = self._disk_cache_path(key)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(raw)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"⚠️ TTS disk cache write failed: {e}")
+            return
+        
+        with self._disk_cache_lock:
+            self._disk_cache_bytes += len(raw)
+            if self._disk_cache_bytes > DISK_CACHE_MAX_BYTES:
+                self._evict_disk_cache()
+    
+    def _disk_cache_files(self):
+        """(path, mtime, size) of every cached audio file"""
+        files = []
+        for path in self._cache_dir.glob(f"*.{self._format}"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((path, st.st_mtime, st.st_size))
+        return files
+    
+    def _evict_disk_cache(self):
+        """Delete least recently used files until under the size cap (caller holds the lock)"""
+        files = sorted(self._disk_cache_files(), key=lambda f: f[1])
+        total = sum(size for _, _, size in files)
+        for path, _, size in files:
+            if total <= DISK_CACHE_MAX_BYTES:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._disk_cache_bytes = total
+    
+    def clear_cache(self):
+        """Drop all cached synthesized audio, in memory and on disk"""
+        with self._audio_cache_lock:
+            self._audio_cache.clear()
+            self._audio_cache_bytes = 0
+        if self._cache_dir is None:
+            return
+        with self._disk_cache_lock:
+            for path, _, _ in self._disk_cache_files():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._disk_cache_bytes = 0
+    
+    def prefetch(self, text: str, voice_name: Optional[str] = None, **kwargs) -> Future:
+        """
+        Synthesize speech into the caches without playing it
+        
+        Args:
+            text: Text to synthesize
+            voice_name: Override voice (optional)
+            **kwargs: Additional parameters (pitch, rate, volume)
+        
+        Returns:
+            Future that completes once the audio is cached
+        """
+        return self._synth_executor.submit(self._prepare, None, text, voice_name, **kwargs)
+    
+    def _play_chunks(self, chunks: queue.Queue) -> bool:
+        """
+        Play chunks as the synth worker produces them (runs on the play worker)
+        
+        Blocks until playback completes, including the audio still buffered
+        on the device after the last write.
+        """
+        stream = None
+        try:
+            while True:
+                samples = chunks.get()
+                if samples is None:
+                    if stream is None:
+                        return False
+                    self._wait_for_drain(stream)
+                    return True
+                with self._stream_lock:
+                    stream = self._get_stream()
+                    stream.write(samples)
         except Exception as e:
             print(f"❌ Audio playback error: {e}")
+            # Drain so the synth worker isn't left feeding a dead consumer
+            while chunks.get() is not None:
+                pass
             return False
     
+    def speak_async(self, text: str, voice_name: Optional[str] = None, **kwargs) -> Future:
+        """
+        Queue speech without blocking the caller
+        
+        Synthesis starts immediately, so consecutive calls fetch the next
+        utterance from Polly while the previous one is still playing.
+        
+        Args:
+            text: Text to speak
+            voice_name: Override voice (optional)
+            **kwargs: Additional parameters (pitch, rate, volume)
+        
+        Returns:
+            Future resolving to True once the text has been spoken (played
+            out on the device, not just queued)
+        """
+        if not self.enabled:
+            done = Future()
+            done.set_result(False)
+            return done
+        
+        chunks = queue.Queue()
+        self._synth_executor.submit(self._prepare, chunks, text, voice_name, **kwargs)
+        return self._play_executor.submit(self._play_chunks, chunks)
+    
     def speak(self, text: str, voice_name: Optional[str] = None, **kwargs) -> bool:
         """
         Synthesize and play speech
@@ -239,20 +798,11 @@ class TTSManager:
         if not self.enabled:
             return False
         
-        audio_data = self.synthesize(text, voice_name, **kwargs)
-        if audio_data:
-            return self.play_audio(audio_data)
-        
-        return False
+        return self.speak_async(text, voice_name, **kwargs).result()
     
     def _escape_ssml(self, text: str) -> str:
         """Escape special characters for SSML"""
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&apos;")
-        return text
+        return text.translate(self._SSML_ESCAPE)
     
     def calculate_cost(self, text: str) -> float:
         """
@@ -286,4 +836,18 @@ class TTSManager:
     def is_enabled(self) -> bool:
         """Check if TTS is enabled"""
         return self.enabled
+    
+    def close(self):
+        """Stop background workers and release the audio device"""
+        self._synth_executor.shutdown(wait=False)
+        self._play_executor.shutdown(wait=True)
+        
+        with self._stream_lock:
+            if self._stream is not None:
+                try:
+                    self._stream.stop()
+                    self._stream.close()
+                except Exception as e:
+                    print(f"⚠️ Could not close audio stream: {e}")
+                self._stream = None
 
@@ -3,9 +3,41 @@ Voice Manager - Coordinates STT and TTS
 Main interface for voice input/output in Microbot
 """
 
-from typing import Optional, Tuple
+import asyncio
+import logging
+import re
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Tuple
 from .tts_manager import TTSManager
 from .stt_manager import STTManager
+from ...utils.config_store import WORKSPACE_ROOT
+
+
+log = logging.getLogger(__name__)
+
+# Synthesized audio persisted across runs (keyed by voice, prosody and text)
+TTS_CACHE_DIR = WORKSPACE_ROOT / ".tts_cache"
+
+# Prosody parameters per emotion (shared - callers must not mutate the entries)
+_EMOTION_MAP = MappingProxyType({
+    "neutral": {"pitch": "+0%", "rate": "100%", "volume": "medium"},
+    "happy": {"pitch": "+5%", "rate": "110%", "volume": "loud"},
+    "cheerful": {"pitch": "+5%", "rate": "110%", "volume": "loud"},
+    "excited": {"pitch": "+10%", "rate": "115%", "volume": "x-loud"},
+    "sad": {"pitch": "-5%", "rate": "85%", "volume": "soft"},
+    "disappointed": {"pitch": "-5%", "rate": "85%", "volume": "soft"},
+    "angry": {"pitch": "-8%", "rate": "100%", "volume": "x-loud"},
+    "frustrated": {"pitch": "-8%", "rate": "100%", "volume": "x-loud"},
+    "friendly": {"pitch": "+3%", "rate": "105%", "volume": "medium"},
+    "warm": {"pitch": "+3%", "rate": "105%", "volume": "medium"},
+})
+_NEUTRAL = _EMOTION_MAP["neutral"]
+
+# Streaming TTS flushes text to Polly at sentence ends and line breaks, and
+# at commas once a clause has grown long enough to be worth its own request
+_SENTENCE_END = re.compile(r'[.!?]+\s|\n')
+_CLAUSE_END = re.compile(r',\s')
+STREAM_CLAUSE_MIN_CHARS = 120
 
 
 class VoiceManager:
@@ -15,7 +47,9 @@ class VoiceManager:
                  aws_access_key: Optional[str] = None,
                  aws_secret_key: Optional[str] = None,
                  config_store = None,
-                 use_advanced_audio: bool = False):
+                 use_advanced_audio: bool = False,
+                 polly_connect_timeout: float = 10,
+                 polly_read_timeout: float = 5):
         """
         Initialize Voice Manager with PHASE 1 ML-grade audio processing
         
@@ -25,9 +59,14 @@ class VoiceManager:
             aws_secret_key: AWS secret key (or use env variable)
             config_store: ConfigStore instance for persisting voice settings
             use_advanced_audio: Enable PHASE 1 advanced audio processing
+            polly_connect_timeout: Seconds to wait for a Polly connection
+            polly_read_timeout: Seconds to wait for each Polly audio stream read
         """
         self.tts = None
         self.stt = None
+        self._tts_speak = None
+        self._stt_listen = None
+        self._lang_code = None
         self.config = config_store
         self.use_advanced_audio = use_advanced_audio
         
@@ -36,7 +75,10 @@ class VoiceManager:
             self.tts = TTSManager(
                 aws_region=aws_region,
                 aws_access_key=aws_access_key,
-                aws_secret_key=aws_secret_key
+                aws_secret_key=aws_secret_key,
+                connect_timeout=polly_connect_timeout,
+                read_timeout=polly_read_timeout,
+                cache_dir=TTS_CACHE_DIR
             )
             print("✅ TTS (Text-to-Speech) ready")
         except Exception as e:
@@ -57,6 +99,12 @@ class VoiceManager:
             print("   Voice input will be disabled.")
             self.stt = None
         
+        # Bound methods for the per-turn hot paths
+        if self.tts:
+            self._tts_speak = self.tts.speak
+        if self.stt:
+            self._stt_listen = self.stt.listen
+        
         # Voice mode state
         self.voice_mode_active = False
         self.current_language = "english"
@@ -66,6 +114,18 @@ class VoiceManager:
             saved_voice = self.config.get_current_voice()
             self.tts.set_voice(saved_voice)
     
+    @property
+    def current_language(self) -> str:
+        """Current conversation language"""
+        return self._current_language
+    
+    @current_language.setter
+    def current_language(self, language: str):
+        self._current_language = language
+        # Resolve the recognizer language code once per change, not per listen
+        if self.stt:
+            self._lang_code = self.stt.get_language_code(language)
+    
     def activate_voice_mode(self, language: str = "english") -> Tuple[bool, str]:
         """
         Activate voice mode (both STT and TTS)
@@ -83,14 +143,15 @@ class VoiceManager:
         self.current_language = language
         
         # Set appropriate voice based on language
-        if self.tts:
-            voice = self.tts.get_voice_for_language(language)
-            self.tts.set_voice(voice)
+        voice_info = self.tts.apply_voice_for_language(language) if self.tts else None
+        
+        # Open the mic now so noise calibration finishes before the first listen
+        if self.stt:
+            self.stt.prepare_microphone()
         
         message = "🎙️ Voice Mode Activated!\n\n"
         
-        if self.tts:
-            voice_info = self.tts.VOICES[self.tts.current_voice]
+        if voice_info:
             message += f"🔊 Voice Output: {voice_info['voice_id']} ({voice_info['description']})\n"
         else:
             message += "🔇 Voice Output: Not available\n"
@@ -114,9 +175,14 @@ class VoiceManager:
             Confirmation message
         """
         self.voice_mode_active = False
+        
+        # Keep the output stream for the next activation, just stop it
+        if self.tts:
+            self.tts.pause_stream()
+        
         return "✅ Voice mode deactivated. Back to text chat."
     
-    def listen_for_input(self, timeout: int = 20) -> Tuple[bool, str]:
+    def listen_for_input(self, timeout: float = 20) -> Tuple[bool, str]:
         """
         Listen for voice input - natural conversation timing
         
@@ -129,14 +195,11 @@ class VoiceManager:
         if not self.voice_mode_active:
             return False, "Voice mode not active"
         
-        if not self.stt:
+        if not self._stt_listen:
             return False, "Speech recognition not available"
         
-        # Get language code for recognition
-        lang_code = self.stt.get_language_code(self.current_language)
-        
         # Listen with natural timeout
-        return self.stt.listen(timeout=timeout, language=lang_code)
+        return self._stt_listen(timeout=timeout, language=self._lang_code)
     
     def speak_response(self, text: str, emotion: str = "neutral") -> bool:
         """
@@ -152,14 +215,127 @@ class VoiceManager:
         if not self.voice_mode_active:
             return False
         
-        if not self.tts:
+        if not self._tts_speak:
+            return False
+        
+        # Speak
+        return self._tts_speak(text, **_EMOTION_MAP.get(emotion.lower(), _NEUTRAL))
+    
+    def speak_response_stream(self, token_iter: Iterable[str], emotion: str = "neutral") -> bool:
+        """
+        Speak an LLM response while it is still being generated
+        
+        Text is cut at sentence boundaries and each piece is queued for
+        synthesis as soon as it is complete, so the first sentence plays
+        while later ones are still streaming in.
+        
+        Args:
+            token_iter: Iterable of text fragments (e.g. LLM stream chunks)
+            emotion: Emotion for speech (neutral, happy, sad, etc.)
+        
+        Returns:
+            True if every piece was spoken successfully
+        """
+        if not self.voice_mode_active or not self.tts:
             return False
         
-        # Get emotion parameters
         params = self._get_emotion_parameters(emotion)
+        pending = []
+        buf = ""
+        
+        for token in token_iter:
+            buf += token
+            while True:
+                match = _SENTENCE_END.search(buf)
+                if match is None and len(buf) >= STREAM_CLAUSE_MIN_CHARS:
+                    match = _CLAUSE_END.search(buf)
+                if match is None:
+                    break
+                
+                sentence = buf[:match.end()].strip()
+                buf = buf[match.end():]
+                if sentence:
+                    # TTS plays queued pieces in order on its own worker
+                    pending.append(self.tts.speak_async(sentence, **params))
+        
+        tail = buf.strip()
+        if tail:
+            pending.append(self.tts.speak_async(tail, **params))
+        
+        return bool(pending) and all([f.result() for f in pending])
+    
+    async def speak_response_async(self, text: str, emotion: str = "neutral") -> bool:
+        """
+        Speak response without blocking the event loop
         
-        # Speak
-        return self.tts.speak(text, **params)
+        Args:
+            text: Text to speak
+            emotion: Emotion for speech (neutral, happy, sad, etc.)
+        
+        Returns:
+            True if spoken successfully
+        """
+        if not self.voice_mode_active or not self.tts:
+            return False
+        
+        params = self._get_emotion_parameters(emotion)
+        return await asyncio.wrap_future(self.tts.speak_async(text, **params))
+    
+    async def listen_for_input_async(self, timeout: float = 20) -> Tuple[bool, str]:
+        """
+        Listen for voice input on a worker thread
+        
+        Args:
+            timeout: Seconds to wait for speech
+        
+        Returns:
+            Tuple of (success, text or error_message)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.listen_for_input, timeout)
+    
+    async def turn(self, text: str, emotion: str = "neutral",
+                   timeout: float = 20) -> Tuple[bool, str]:
+        """
+        Speak a response, then listen for the reply
+        
+        Microphone warmup runs concurrently with synthesis and playback, and
+        listening starts the moment playback finishes. The TTS future only
+        resolves once the device has played out its buffered tail, so the mic
+        never opens while the bot's own voice is still audible.
+        
+        Args:
+            text: Text to speak
+            emotion: Emotion for speech
+            timeout: Seconds to wait for the reply
+        
+        Returns:
+            Tuple of (success, text or error_message)
+        """
+        loop = asyncio.get_running_loop()
+        pending = [self.speak_response_async(text, emotion)]
+        if self.stt:
+            pending.append(loop.run_in_executor(None, self.stt.prepare_microphone))
+        # Both must finish first: the speech future covers the device's
+        # buffered audio, not just the last write
+        await asyncio.gather(*pending)
+        
+        return await self.listen_for_input_async(timeout)
+    
+    def prewarm_cache(self, phrases: List[str], emotion: str = "neutral"):
+        """
+        Synthesize phrases in the background so their first use skips Polly
+        
+        Args:
+            phrases: Texts that will be spoken later
+            emotion: Emotion the phrases will be spoken with
+        """
+        if not self.tts:
+            return
+        
+        params = self._get_emotion_parameters(emotion)
+        for phrase in phrases:
+            self.tts.prefetch(phrase, **params)
     
     def set_voice(self, voice_name: str) -> Tuple[bool, str]:
         """
@@ -209,9 +385,8 @@ class VoiceManager:
         
         if self.tts and self.voice_mode_active:
             # Auto-switch voice based on language
-            voice = self.tts.get_voice_for_language(language)
-            self.tts.set_voice(voice)
-            print(f"🌍 Language changed to {language}, voice auto-switched to {voice}")
+            voice_info = self.tts.apply_voice_for_language(language)
+            log.info("🌍 Language changed to %s, voice auto-switched to %s", language, voice_info["voice_id"])
     
     def _get_emotion_parameters(self, emotion: str) -> dict:
         """
@@ -223,20 +398,7 @@ class VoiceManager:
         Returns:
             Dict with pitch, rate, volume parameters
         """
-        emotion_map = {
-            "neutral": {"pitch": "+0%", "rate": "100%", "volume": "medium"},
-            "happy": {"pitch": "+5%", "rate": "110%", "volume": "loud"},
-            "cheerful": {"pitch": "+5%", "rate": "110%", "volume": "loud"},
-            "excited": {"pitch": "+10%", "rate": "115%", "volume": "x-loud"},
-            "sad": {"pitch": "-5%", "rate": "85%", "volume": "soft"},
-            "disappointed": {"pitch": "-5%", "rate": "85%", "volume": "soft"},
-            "angry": {"pitch": "-8%", "rate": "100%", "volume": "x-loud"},
-            "frustrated": {"pitch": "-8%", "rate": "100%", "volume": "x-loud"},
-            "friendly": {"pitch": "+3%", "rate": "105%", "volume": "medium"},
-            "warm": {"pitch": "+3%", "rate": "105%", "volume": "medium"},
-        }
-        
-        return emotion_map.get(emotion.lower(), emotion_map["neutral"])
+        return _EMOTION_MAP.get(emotion.lower(), _NEUTRAL)
     
     def is_voice_mode_active(self) -> bool:
         """Check if voice mode is active"""
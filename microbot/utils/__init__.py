@@ -4,8 +4,10 @@ Utility modules for Microbot
 
 from .time_parser import TimeParser
 from .config_store import ConfigStore
+from .logging_setup import setup_logging
 
 __all__ = [
     "TimeParser",
-    "ConfigStore"
+    "ConfigStore",
+    "setup_logging"
 ]
@@ -6,11 +6,29 @@ Stores all bot settings in config.json at workspace root
 
 from __future__ import annotations
 
-import json
+import atexit
+import base64
+import copy
 import hashlib
+import hmac
+import json
+import logging
+import mmap
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+try:
+    # Rust JSON encoder - much faster than stdlib json with indent
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
+log = logging.getLogger(__name__)
 
 # Config file at workspace root (not in legacy_code)
 WORKSPACE_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -20,6 +38,96 @@ CONFIG_PATH = WORKSPACE_ROOT / "config.json"
 LEGACY_CONFIG_PATH = WORKSPACE_ROOT / "legacy_code" / "config.json"
 LEGACY_STATE_PATH = WORKSPACE_ROOT / "legacy_code" / "state.json"
 
+# scrypt parameters for password / security answer hashing (~16 MB, tens of ms)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+SALT_BYTES = 16
+
+# Setters mark the config dirty; changes made within this window share one write
+SAVE_DEBOUNCE_SECONDS = 0.2
+# After a failed write the pending changes are retried this often
+SAVE_RETRY_SECONDS = 5.0
+
+# Config files larger than this are parsed straight from a memory map
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Default settings; loaded config is deep-merged over a copy of this
+_DEFAULTS = {
+    "bot_name": "Microbot",
+    "password_hash": None,
+    "language": "hinglish",  # english | hinglish | marathi
+    "security_questions": {},  # Store security questions and their hashed answers
+    "current_mode": "normal",  # normal | notes | pomodoro | voice
+    "mode_states": {
+        "notes_active": False,
+        "pomodoro_active": False,
+        "voice_active": False
+    },
+    "voice_settings": {
+        "enabled": True,
+        "english_voice": "justin",  # matthew | justin | salli
+        "hinglish_voice": "aditi",   # aditi (Indian female voice)
+        "current_voice": "aditi",
+        "aws_configured": False
+    }
+}
+
+# Language -> voice_settings key holding the voice for it, with that key's default
+_LANG_TO_VOICE_KEY = {
+    "english": ("english_voice", "justin"),
+    "hinglish": ("hinglish_voice", "aditi"),
+    "marathi": ("hinglish_voice", "aditi"),
+    "hindi": ("hinglish_voice", "aditi"),
+}
+_ENGLISH_VOICE_KEY = _LANG_TO_VOICE_KEY["english"]
+
+
+def _deep_merge(base: dict, override: dict) -> dict:
+    """Recursively merge override into base (in place) and return base"""
+    for key, value in override.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_merge(current, value)
+        else:
+            base[key] = value
+    return base
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, memory-mapping large files so orjson reads them in place"""
+    if ORJSON_AVAILABLE and path.stat().st_size > MMAP_THRESHOLD_BYTES:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            with memoryview(buf) as view:
+                return orjson.loads(view)
+    return _loads(path.read_bytes())
+
+
+# Every live store, so one exit hook can flush them all without keeping them alive
+_open_stores = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_stores():
+    """Write pending changes of every live ConfigStore on interpreter exit"""
+    for store in list(_open_stores):
+        store.close()
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class ConfigStore:
     """Centralized configuration store for all bot settings"""
@@ -27,127 +135,188 @@ class ConfigStore:
     def __init__(self, path: Path = CONFIG_PATH):
         self.path = path
         self._info = None  # Store documentation field separately
-        self.data = {
-            "bot_name": "Microbot",
-            "password_hash": None,
-            "language": "hinglish",  # english | hinglish | marathi
-            "security_questions": {},  # Store security questions and their hashed answers
-            "current_mode": "normal",  # normal | notes | pomodoro | voice
-            "mode_states": {
-                "notes_active": False,
-                "pomodoro_active": False,
-                "voice_active": False
-            },
-            "voice_settings": {
-                "enabled": True,
-                "english_voice": "justin",  # matthew | justin | salli
-                "hinglish_voice": "aditi",   # aditi (Indian female voice)
-                "aws_configured": False
-            }
-        }
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # Guards data as well as the save state: setters mutate under it so a
+        # write never serializes a half-applied change
+        self._save_lock = threading.RLock()
         self.load()
+        # Flush any pending debounced write on interpreter exit
+        _open_stores.add(self)
 
     def load(self):
         """Load configuration from file, migrating from legacy if needed"""
+        self.data = copy.deepcopy(_DEFAULTS)
+        
         # Try new location first
         if self.path.exists():
             try:
-                loaded_data = json.loads(self.path.read_text(encoding="utf-8"))
+                loaded_data = _read_json(self.path)
                 # Preserve _info field if it exists
                 if "_info" in loaded_data:
                     self._info = loaded_data.pop("_info")
                 else:
                     self._info = None
-                self.data.update(loaded_data)
+                _deep_merge(self.data, loaded_data)
             except Exception:
                 pass
         # Migrate from legacy config.json
         elif LEGACY_CONFIG_PATH.exists():
             try:
-                legacy = json.loads(LEGACY_CONFIG_PATH.read_text(encoding="utf-8"))
+                legacy = _read_json(LEGACY_CONFIG_PATH)
                 if isinstance(legacy, dict):
-                    self.data.update(legacy)
-                print(f"📦 Migrated config from legacy_code to {self.path}")
+                    _deep_merge(self.data, legacy)
+                log.info("📦 Migrated config from legacy_code to %s", self.path)
                 self.save()  # Save to new location
             except Exception:
                 pass
         # Migrate from legacy state.json
         elif LEGACY_STATE_PATH.exists():
             try:
-                legacy = json.loads(LEGACY_STATE_PATH.read_text(encoding="utf-8"))
+                legacy = _read_json(LEGACY_STATE_PATH)
                 if isinstance(legacy, dict):
                     self.data["bot_name"] = legacy.get("bot_name", self.data["bot_name"])
                     self.data["password_hash"] = legacy.get("password_hash", self.data["password_hash"])
-                print(f"📦 Migrated config from legacy state.json to {self.path}")
+                log.info("📦 Migrated config from legacy state.json to %s", self.path)
                 self.save()  # Save to new location
             except Exception:
                 pass
         
-        # Ensure defaults
-        self.data.setdefault("bot_name", "Microbot")
-        self.data.setdefault("password_hash", None)
-        self.data.setdefault("language", "hinglish")
-        self.data.setdefault("security_questions", {})
-        self.data.setdefault("current_mode", "normal")
-        self.data.setdefault("mode_states", {
-            "notes_active": False,
-            "pomodoro_active": False,
-            "voice_active": False
-        })
-        self.data.setdefault("voice_settings", {
-            "enabled": True,
-            "english_voice": "justin",
-            "hinglish_voice": "aditi",
-            "current_voice": "aditi",
-            "aws_configured": False
-        })
+        # Cached views so the hot-path getters skip the lookup and default dict
+        self._voice_settings = self.data["voice_settings"]
+        self._mode_states = self.data["mode_states"]
 
     def save(self):
-        """Save configuration to file, preserving documentation"""
-        try:
-            # Create output dict with _info first (if it exists)
-            output = {}
-            if hasattr(self, '_info') and self._info:
-                output["_info"] = self._info
-            
-            # Add all config data
-            output.update(self.data)
+        """
+        Schedule a save of the configuration
+        
+        Writes are throttled: the first save arms a SAVE_DEBOUNCE_SECONDS
+        timer and every change made before it fires goes into that one write.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._arm_timer(SAVE_DEBOUNCE_SECONDS)
+
+    def _arm_timer(self, delay: float):
+        """Start the timer that runs _flush (caller holds _save_lock)"""
+        self._save_timer = threading.Timer(delay, self._flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _flush(self):
+        """Write configuration to file atomically, preserving documentation"""
+        with self._save_lock:
+            # A stale timer that fired while close() flushed leaves a newer one alone
+            if self._save_timer is threading.current_thread():
+                self._save_timer = None
+            if not self._dirty:
+                return
             
-            self.path.write_text(
-                json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8"
-            )
-            print(f"💾 Config saved to {self.path.name}")
-        except Exception as e:
-            print(f"⚠️ Warning: Could not save config: {e}")
+            tmp_path = self.path.with_suffix(".json.tmp")
+            try:
+                # Create output dict with _info first (if it exists)
+                output = {}
+                if self._info:
+                    output["_info"] = self._info
+                
+                # Add all config data
+                output.update(self.data)
+                
+                # Write a temp file and rename over the config so a crash
+                # mid-write never leaves a torn config.json
+                tmp_path.write_bytes(_dumps(output))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                log.debug("💾 Config saved to %s", self.path.name)
+            except Exception as e:
+                log.warning("⚠️ Warning: Could not save config: %s", e)
+                # Keep the changes pending and try again later
+                if self._save_timer is None:
+                    self._arm_timer(SAVE_RETRY_SECONDS)
+
+    def close(self):
+        """Cancel the debounce timer and write any pending changes now"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._flush()
 
     # Password helpers
     @staticmethod
-    def _hash(pw: str) -> str:
-        return hashlib.sha256(pw.encode("utf-8")).hexdigest()
+    def _derive(secret: str, salt: bytes) -> bytes:
+        return hashlib.scrypt(
+            secret.encode("utf-8"), salt=salt,
+            n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=SCRYPT_DKLEN
+        )
+
+    @classmethod
+    def _hash(cls, secret: str) -> dict:
+        """Hash a secret with a fresh random salt"""
+        salt = os.urandom(SALT_BYTES)
+        return {
+            "algo": "scrypt",
+            "salt": base64.b64encode(salt).decode("ascii"),
+            "hash": base64.b64encode(cls._derive(secret, salt)).decode("ascii"),
+        }
+
+    @classmethod
+    def _verify(cls, secret: str, stored) -> Tuple[bool, bool]:
+        """
+        Check a secret against a stored hash in constant time
+
+        Returns:
+            (matches, needs_upgrade) - needs_upgrade is True for legacy
+            unsalted SHA-256 hashes that should be re-hashed with scrypt
+        """
+        if isinstance(stored, dict) and stored.get("algo") == "scrypt":
+            try:
+                salt = base64.b64decode(stored["salt"])
+                expected = base64.b64decode(stored["hash"])
+            except (KeyError, ValueError):
+                return False, False
+            return hmac.compare_digest(cls._derive(secret, salt), expected), False
+        
+        if isinstance(stored, str):
+            legacy = hashlib.sha256(secret.encode("utf-8")).hexdigest()
+            matches = hmac.compare_digest(legacy, stored)
+            return matches, matches
+        
+        return False, False
 
     def has_password(self) -> bool:
         return bool(self.data.get("password_hash"))
 
     def check_password(self, pw: str) -> bool:
         ph = self.data.get("password_hash")
-        return bool(ph) and self._hash(pw) == ph
+        if not ph:
+            return False
+        matches, needs_upgrade = self._verify(pw, ph)
+        if needs_upgrade:
+            self.set_password(pw)
+        return matches
 
     def set_password(self, pw: str):
-        self.data["password_hash"] = self._hash(pw)
-        self.save()
+        password_hash = self._hash(pw)
+        with self._save_lock:
+            self.data["password_hash"] = password_hash
+            self.save()
 
     # Name helpers
     def set_name(self, name: str):
-        self.data["bot_name"] = name.strip()
-        self.save()
+        with self._save_lock:
+            self.data["bot_name"] = name.strip()
+            self.save()
 
     # Language helpers
     def set_language(self, lang: str):
         lang = (lang or "").strip().lower()
         if lang in {"english", "hinglish", "marathi"}:
-            self.data["language"] = lang
-            self.save()
-            print(f"✅ Language saved to config: {lang}")
+            with self._save_lock:
+                self.data["language"] = lang
+                self.save()
+            log.info("✅ Language saved to config: %s", lang)
 
     def language(self) -> str:
         return (self.data.get("language") or "hinglish").lower()
@@ -159,13 +328,12 @@ class ConfigStore:
     
     def set_security_question(self, question: str, answer: str):
         """Set a security question and its hashed answer"""
-        if "security_questions" not in self.data:
-            self.data["security_questions"] = {}
-        
         # Normalize the answer (lowercase, strip spaces)
         normalized_answer = answer.strip().lower()
-        self.data["security_questions"][question] = self._hash(normalized_answer)
-        self.save()
+        answer_hash = self._hash(normalized_answer)
+        with self._save_lock:
+            self.data.setdefault("security_questions", {})[question] = answer_hash
+            self.save()
     
     def check_security_answer(self, question: str, answer: str) -> bool:
         """Check if the answer to a security question is correct"""
@@ -178,7 +346,13 @@ class ConfigStore:
         
         # Normalize the provided answer
         normalized_answer = answer.strip().lower()
-        return self._hash(normalized_answer) == stored_hash
+        matches, needs_upgrade = self._verify(normalized_answer, stored_hash)
+        if needs_upgrade:
+            answer_hash = self._hash(normalized_answer)
+            with self._save_lock:
+                self.data["security_questions"][question] = answer_hash
+                self.save()
+        return matches
     
     def get_security_questions(self) -> list:
         """Get list of security questions"""
@@ -188,8 +362,9 @@ class ConfigStore:
     
     def clear_security_questions(self):
         """Clear all security questions"""
-        self.data["security_questions"] = {}
-        self.save()
+        with self._save_lock:
+            self.data["security_questions"] = {}
+            self.save()
     
     def reset_password_with_security(self, new_password: str):
         """Reset password after security question verification"""
@@ -203,23 +378,18 @@ class ConfigStore:
     def set_mode(self, mode: str):
         """Set the current mode (normal, notes, pomodoro, voice)"""
         if mode in {"normal", "notes", "pomodoro", "voice"}:
-            self.data["current_mode"] = mode
-            # Update mode states
-            if "mode_states" not in self.data:
-                self.data["mode_states"] = {}
-            self.data["mode_states"]["notes_active"] = (mode == "notes")
-            self.data["mode_states"]["pomodoro_active"] = (mode == "pomodoro")
-            self.data["mode_states"]["voice_active"] = (mode == "voice")
-            self.save()
-            print(f"✅ Mode saved to config: {mode}")
+            with self._save_lock:
+                self.data["current_mode"] = mode
+                # Update mode states
+                self._mode_states["notes_active"] = (mode == "notes")
+                self._mode_states["pomodoro_active"] = (mode == "pomodoro")
+                self._mode_states["voice_active"] = (mode == "voice")
+                self.save()
+            log.info("✅ Mode saved to config: %s", mode)
     
     def get_mode_states(self) -> dict:
         """Get all mode states"""
-        return self.data.get("mode_states", {
-            "notes_active": False,
-            "pomodoro_active": False,
-            "voice_active": False
-        })
+        return self._mode_states
     
     def get_all_settings(self) -> dict:
         """Get all settings in a readable format"""
@@ -236,80 +406,66 @@ class ConfigStore:
     # Voice settings helpers
     def get_voice_settings(self) -> dict:
         """Get voice settings"""
-        return self.data.get("voice_settings", {
-            "enabled": True,
-            "english_voice": "justin",
-            "hinglish_voice": "aditi",
-            "current_voice": "aditi",
-            "aws_configured": False
-        })
+        return self._voice_settings
     
     def set_english_voice(self, voice: str):
         """Set English voice (matthew, justin, salli)"""
         if voice.lower() in {"matthew", "justin", "salli"}:
-            if "voice_settings" not in self.data:
-                self.data["voice_settings"] = {}
-            self.data["voice_settings"]["english_voice"] = voice.lower()
-            self.save()
-            print(f"✅ English voice set to: {voice}")
+            with self._save_lock:
+                self._voice_settings["english_voice"] = voice.lower()
+                self.save()
+            log.info("✅ English voice set to: %s", voice)
     
     def set_hinglish_voice(self, voice: str):
         """Set Hinglish voice (currently only aditi)"""
         if voice.lower() == "aditi":
-            if "voice_settings" not in self.data:
-                self.data["voice_settings"] = {}
-            self.data["voice_settings"]["hinglish_voice"] = voice.lower()
-            self.save()
-            print(f"✅ Hinglish voice set to: {voice}")
+            with self._save_lock:
+                self._voice_settings["hinglish_voice"] = voice.lower()
+                self.save()
+            log.info("✅ Hinglish voice set to: %s", voice)
     
     def get_voice_for_language(self, language: Optional[str] = None) -> str:
         """Get appropriate voice for language"""
         if language is None:
             language = self.language()
         
-        voice_settings = self.get_voice_settings()
-        
-        if language.lower() in ["hinglish", "marathi", "hindi"]:
-            return voice_settings.get("hinglish_voice", "aditi")
-        else:
-            return voice_settings.get("english_voice", "justin")
+        # Stored languages are already lowercase; only lower() on a miss
+        entry = _LANG_TO_VOICE_KEY.get(language)
+        if entry is None:
+            entry = _LANG_TO_VOICE_KEY.get(language.lower(), _ENGLISH_VOICE_KEY)
+        key, default = entry
+        return self._voice_settings.get(key, default)
     
     def set_voice_enabled(self, enabled: bool):
         """Enable/disable voice mode"""
-        if "voice_settings" not in self.data:
-            self.data["voice_settings"] = {}
-        self.data["voice_settings"]["enabled"] = enabled
-        self.save()
-        print(f"✅ Voice mode {'enabled' if enabled else 'disabled'}")
+        with self._save_lock:
+            self._voice_settings["enabled"] = enabled
+            self.save()
+        log.info("✅ Voice mode %s", "enabled" if enabled else "disabled")
     
     def is_voice_enabled(self) -> bool:
         """Check if voice mode is enabled"""
-        voice_settings = self.get_voice_settings()
-        return voice_settings.get("enabled", True)
+        return self._voice_settings.get("enabled", True)
     
     def set_aws_configured(self, configured: bool):
         """Mark AWS credentials as configured"""
-        if "voice_settings" not in self.data:
-            self.data["voice_settings"] = {}
-        self.data["voice_settings"]["aws_configured"] = configured
-        self.save()
+        with self._save_lock:
+            self._voice_settings["aws_configured"] = configured
+            self.save()
     
     def is_aws_configured(self) -> bool:
         """Check if AWS credentials are configured"""
-        voice_settings = self.get_voice_settings()
-        return voice_settings.get("aws_configured", False)
+        return self._voice_settings.get("aws_configured", False)
     
     def get_current_voice(self) -> str:
         """Get the currently active voice"""
-        voice_settings = self.get_voice_settings()
-        return voice_settings.get("current_voice", "aditi")
+        return self._voice_settings.get("current_voice", "aditi")
     
     def set_current_voice(self, voice: str):
         """Set the current active voice"""
         if voice.lower() in {"matthew", "justin", "salli", "aditi"}:
-            if "voice_settings" not in self.data:
-                self.data["voice_settings"] = {}
-            self.data["voice_settings"]["current_voice"] = voice.lower()
-            self.save()
-            print(f"✅ Current voice updated to: {voice}")
+            with self._save_lock:
+                self._voice_settings["current_voice"] = voice.lower()
+                self.save()
+            log.info("✅ Current voice updated to: %s", voice)
 
@@ -4,12 +4,18 @@ Provides a centralized client for Google Gemini AI
 """
 
 import os
+import threading
 import google.generativeai as genai
 
 
+# Shared model instance - created on the first make_client() call
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
 def make_client():
     """
-    Create and return a Google Gemini AI client
+    Return the shared Google Gemini AI client, creating it on first use
     
     Returns:
         genai.GenerativeModel: Configured Gemini AI model
@@ -17,6 +23,18 @@ def make_client():
     Raises:
         ValueError: If API key is not found in environment variables
     """
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+    
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = _create_client()
+        return _CLIENT
+
+
+def _create_client():
+    """Configure the API and build the model (called once)"""
     # Get API key from environment variables
     key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     
@@ -39,22 +57,15 @@ def make_client():
     # Default to gemini-2.5-flash for best compatibility
     model_name = os.getenv("GENAI_MODEL", "gemini-2.5-flash")
     
-    # Try the requested model first, then fallbacks
-    models_to_try = [
-        model_name,
-        "gemini-2.5-flash",
-        "gemini-2.5-pro",
-        "gemini-2.0-flash-exp",
-    ]
-    
-    for try_model in models_to_try:
+    # GenerativeModel() is a local constructor and never contacts the server,
+    # so an unknown model only fails on first use. Set GENAI_VALIDATE_MODEL=1
+    # to check it up front with a cheap token count instead.
+    model = genai.GenerativeModel(model_name)
+    if os.getenv("GENAI_VALIDATE_MODEL") == "1":
         try:
-            model = genai.GenerativeModel(try_model)
-            # Test if model works by checking it can be used
-            print(f"✅ Using Gemini model: {try_model}")
-            return model
+            model.count_tokens("ping")
         except Exception as e:
-            print(f"⚠️ Model {try_model} not available: {e}")
-            continue
+            raise ValueError(f"Gemini model {model_name} not available: {e}")
     
-    raise ValueError(f"Could not initialize any Gemini model. Please check your API key and available models.")
+    print(f"✅ Using Gemini model: {model_name}")
+    return model
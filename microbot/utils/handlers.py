@@ -3,6 +3,18 @@ Handlers Module
 Provides utility functions for parsing and rendering data
 """
 
+import re
+
+
+# Multiplication table patterns, compiled once at import
+# Examples: "table of 5", "5 ka table", "multiplication table of 7"
+# ("multiplication table of N" is matched by the first pattern)
+_TABLE_PATTERNS = (
+    re.compile(r'table\s+of\s+(\d+)'),
+    re.compile(r'(\d+)\s+ka\s+table'),
+)
+_UPTO_RE = re.compile(r'(?:upto|up\s+to|till)\s+(\d+)')
+
 
 def parse_table_request(user_input: str):
     """
@@ -14,26 +26,16 @@ def parse_table_request(user_input: str):
     Returns:
         tuple: (n, upto) for table request, or None if not a table request
     """
-    import re
-    
-    # Check for multiplication table patterns
-    # Examples: "table of 5", "5 ka table", "multiplication table of 7"
-    patterns = [
-        r'table\s+of\s+(\d+)',
-        r'(\d+)\s+ka\s+table',
-        r'multiplication\s+table\s+of\s+(\d+)',
-    ]
-    
     user_lower = user_input.lower()
-    for pattern in patterns:
-        match = re.search(pattern, user_lower)
+    for pattern in _TABLE_PATTERNS:
+        match = pattern.search(user_lower)
         if match:
             n = int(match.group(1))
             # Default to showing table up to 10
             upto = 10
             
             # Check if user specified "upto" value
-            upto_match = re.search(r'(?:upto|up\s+to|till)\s+(\d+)', user_lower)
+            upto_match = _UPTO_RE.search(user_lower)
             if upto_match:
                 upto = int(upto_match.group(1))
             
@@ -54,14 +56,5 @@ def render_table(n: int, upto: int = 10) -> str:
     Returns:
         str: Formatted multiplication table as string
     """
-    # Generate multiplication table
-    table_lines = []
-    table_lines.append(f"Multiplication table of {n}:")
-    table_lines.append("-" * 30)
-    
-    for i in range(1, upto + 1):
-        result = n * i
-        table_lines.append(f"{n} × {i} = {result}")
-    
-    return "\n".join(table_lines)
-
+    rows = "".join(f"\n{n} × {i} = {n * i}" for i in range(1, upto + 1))
+    return f"Multiplication table of {n}:\n{'-' * 30}{rows}"
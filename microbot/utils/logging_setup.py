@@ -0,0 +1,50 @@
+"""
+Logging Setup Module
+Routes Microbot log records through a queue so formatting and console
+I/O happen on a background thread instead of the caller's
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Optional
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(level: Optional[str] = None) -> logging.Logger:
+    """
+    Configure the "microbot" logger with a non-blocking queue handler
+
+    Safe to call more than once; only the first call installs handlers.
+
+    Args:
+        level: Log level name (default: MICROBOT_LOG_LEVEL env var, or INFO)
+
+    Returns:
+        The configured "microbot" logger
+    """
+    global _listener
+    log = logging.getLogger("microbot")
+    if _listener is not None:
+        return log
+
+    level = (level or os.getenv("MICROBOT_LOG_LEVEL") or "INFO").upper()
+    log.setLevel(level)
+
+    # Messages already carry their own emoji prefixes - print them as-is
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, console)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return log
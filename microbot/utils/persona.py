@@ -3,19 +3,49 @@ Persona Module
 Provides personality and tone management for AI responses
 """
 
+import re
 
-def build_persona(language: str = "english") -> str:
+try:
+    # Aho-Corasick automaton - matches every keyword in one pass over the text
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _keyword_matcher(keywords):
     """
-    Build a persona/system prompt for the AI based on language
+    Build a predicate telling whether text contains any of the keywords
     
-    Args:
-        language: Language to use ('english', 'hinglish', 'marathi')
-        
-    Returns:
-        str: Persona instructions for the AI
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, else a
+    single compiled alternation regex; both scan the text once.
     """
-    if language == "hinglish":
-        return """You are Microbot, a friendly and helpful AI assistant. You speak in Hinglish (mix of Hindi and English). 
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+
+# Keywords that suggest a serious query
+_has_serious_keyword = _keyword_matcher((
+    "doctor", "medicine", "emergency", "urgent", "important",
+    "deadline", "meeting", "work", "business", "health",
+    "problem", "issue", "error", "help me"
+))
+
+# Keywords that suggest wanting more detail
+_has_expansion_keyword = _keyword_matcher((
+    "explain", "detail", "elaborate", "tell me more", "how does",
+    "why does", "what is", "describe", "in detail"
+))
+
+
+_PERSONA_HINGLISH = """You are Microbot, a friendly and helpful AI assistant. You speak in Hinglish (mix of Hindi and English). 
 
 RESPONSE RULES:
 1. Keep responses SHORT (15-20 words max) for casual conversation
@@ -29,8 +59,8 @@ EXAMPLES:
 - "That sounds interesting! Tell me more about it?"
 - "Nice! What made you think of that?"
 """
-    elif language == "marathi":
-        return """You are Microbot, a friendly and helpful AI assistant. You speak in Marathi. 
+
+_PERSONA_MARATHI = """You are Microbot, a friendly and helpful AI assistant. You speak in Marathi. 
 
 RESPONSE RULES:
 1. Keep responses SHORT (15-20 words max) for casual conversation
@@ -38,8 +68,8 @@ RESPONSE RULES:
 3. For technical questions, give brief answer (2-3 sentences) then ask if they want more details
 4. DO NOT USE EMOJIS - this is a voice assistant
 5. Be warm, curious, and engaging"""
-    else:  # english
-        return """You are Microbot, a friendly and helpful AI assistant. 
+
+_PERSONA_EN = """You are Microbot, a friendly and helpful AI assistant. 
 
 RESPONSE RULES:
 1. Keep responses SHORT (15-20 words max) for casual conversation
@@ -54,6 +84,26 @@ EXAMPLES:
 - "Nice! What made you think of that?"
 """
 
+# Persona per language; anything else falls back to English
+_PERSONAS = {
+    "english": _PERSONA_EN,
+    "hinglish": _PERSONA_HINGLISH,
+    "marathi": _PERSONA_MARATHI,
+}
+
+
+def build_persona(language: str = "english") -> str:
+    """
+    Build a persona/system prompt for the AI based on language
+    
+    Args:
+        language: Language to use ('english', 'hinglish', 'marathi')
+        
+    Returns:
+        str: Persona instructions for the AI
+    """
+    return _PERSONAS.get(language, _PERSONA_EN)
+
 
 def childify(text: str, language: str = "english") -> str:
     """
@@ -82,14 +132,7 @@ def looks_serious(user_input: str) -> bool:
         bool: True if query looks serious, False otherwise
     """
     # Simple heuristic: check for serious keywords
-    serious_keywords = [
-        "doctor", "medicine", "emergency", "urgent", "important",
-        "deadline", "meeting", "work", "business", "health",
-        "problem", "issue", "error", "help me"
-    ]
-    
-    user_lower = user_input.lower()
-    return any(keyword in user_lower for keyword in serious_keywords)
+    return _has_serious_keyword(user_input.lower())
 
 
 def want_expanded(user_input: str) -> bool:
@@ -103,11 +146,5 @@ def want_expanded(user_input: str) -> bool:
         bool: True if user wants detailed response
     """
     # Check for keywords that suggest wanting more detail
-    expansion_keywords = [
-        "explain", "detail", "elaborate", "tell me more", "how does",
-        "why does", "what is", "describe", "in detail"
-    ]
-    
-    user_lower = user_input.lower()
-    return any(keyword in user_lower for keyword in expansion_keywords)
+    return _has_expansion_keyword(user_input.lower())
 
@@ -6,87 +6,189 @@ Parses natural language time expressions into datetime objects
 from __future__ import annotations
 import re
 from datetime import datetime, timedelta, time
+from functools import lru_cache
 from typing import Optional, Tuple
-from dateutil.relativedelta import relativedelta
+
+from .genai_client import make_client
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Gemini client for the AI fallback, created on first use"""
+    return make_client()
+
+
+# Inputs are romanized Hindi/English, so every pattern is compiled with
+# re.ASCII: \d, \s and \w skip the Unicode property lookups
+
+# Fast-path minutes: "2 min baad", "5 minute mein", "do minute baad", ...
+# Group 1 holds a digit count, group 2 a number word (see _WORD2N)
+_RE_FALLBACK_MINUTES = re.compile(
+    r'(\d+)\s*min(?:ute)?\s*(?:baad|mein|later)'
+    r'|(do|two|teen|three|char|four|paanch|five)\s*min(?:ute)?\s*(?:baad|mein)',
+    re.ASCII
+)
+_WORD2N = {
+    "do": 2, "two": 2, "teen": 3, "three": 3,
+    "char": 4, "four": 4, "paanch": 5, "five": 5,
+}
+_RE_FALLBACK_HOURS = re.compile(r'(\d+)\s*(?:hour|ghante)', re.ASCII)
+
+# Relative time, one pattern per unit. "in/after N unit" and "N unit baad/mein"
+# need no patterns of their own: each contains an "N unit" match with the
+# same number, so a single search per unit finds them.
+_RE_REL_MINUTES = re.compile(r"(\d+)\s*(?:minute|min|minutes)\s*(?:later|baad|mein)?", re.ASCII)
+_RE_REL_HOURS = re.compile(r"(\d+)\s*(?:hour|hours|ghante|ghanta)\s*(?:later|baad|mein)?", re.ASCII)
+_RE_REL_DAYS = re.compile(r"(\d+)\s*(?:day|days|din)\s*(?:later|baad|mein)?", re.ASCII)
+
+# Relative patterns in priority order with the timedelta unit each one counts
+_REL_UNITS = (
+    (_RE_REL_MINUTES, "minutes"),
+    (_RE_REL_HOURS, "hours"),
+    (_RE_REL_DAYS, "days"),
+)
+
+# Time reference in a reminder: "2 minutes", "5 min"
+_RE_TASK_MINUTES = re.compile(r'(\d+)\s*min(?:ute)?s?', re.ASCII)
+
+# Everything up to and including the first reminder phrase; alternatives are
+# ordered most specific first so the longest phrase at that position wins
+_RE_REMINDER_PREFIX = re.compile(
+    r'^.*?(?:can you remind me that i have to|can you remind me to|can you remind me that'
+    r'|remind me that i have to|remind me i have to|remind me to|remind me that'
+    r'|yaad dilana ki|yaad dilana)\s*',
+    re.DOTALL | re.ASCII
+)
+
+# Run of leading filler words ("that to ...", "you can ...")
+_RE_FILLER = re.compile(r'^(?:(?:that|to|ki|can|you) \s*)+', re.ASCII)
+
+# format_time_naturally templates by (language, how far ahead); the {dt:...}
+# fields are strftime directives, so each template formats dt in one call
+_NATURAL_FORMATS = {
+    ("english", "minutes"): "in {m} minutes",
+    ("english", "today"): "at {dt:%I:%M %p} today",
+    ("english", "tomorrow"): "tomorrow at {dt:%I:%M %p}",
+    ("english", "later"): "on {dt:%A, %B %d at %I:%M %p}",
+    ("hinglish", "minutes"): "{m} minute mein",
+    ("hinglish", "today"): "aaj {dt:%I:%M} baje",
+    ("hinglish", "tomorrow"): "kal {dt:%I:%M} baje",
+    ("hinglish", "later"): "{dt:%A ko %I:%M} baje",
+}
+
+# Gemini prompts for the AI paths; filled with format_map({"now", "text"})
+_PARSE_PROMPT = """Time now: {now}. Parse: "{text}". Format: YYYY-MM-DD HH:MM:SS or NONE"""
+
+_EXTRACT_PROMPT = """Extract task and time from reminder request.
+
+Current time: {now}
+
+Input: "{text}"
+
+Examples:
+- "Remind me in 5 minutes to call John" → Task: "call John", Time: [5 min from now]
+- "set timer 2 minutes I have to sleep" → Task: "sleep", Time: [2 min from now]
+- "5 minute baad yaad dilana medicine" → Task: "medicine", Time: [5 min from now]
+- "2 min mein khana khana" → Task: "khana khana", Time: [2 min from now]
+
+Hindi numbers: do=2, teen=3, char=4, paanch=5
+"baad"/"mein" means "after"/"in"
+"yaad dilana" means "remind"
+
+Calculate exact time from current: {now}
+
+Respond in this exact format:
+TASK: [extracted task]
+TIME: YYYY-MM-DD HH:MM:SS
+
+If no valid task or time can be extracted, respond with:
+TASK: NONE
+TIME: NONE"""
+
+# Entries kept by the memoized fast-path parsers
+PARSE_CACHE_SIZE = 256
+
+# Common tasks: first keyword found in the task (in this order) -> canonical task
+_TASK_CANON = {
+    "eat": "eat",
+    "lunch": "lunch",
+    "khana": "khana khana",
+    "sleep": "sleep",
+    "so": "sleep",
+    "call": "call",
+    "meeting": "meeting",
+}
+
+# Words stripped from a task description, removed in a single pass
+_RE_CLEAN_TASK = re.compile(
+    r"\d+\s*(?:minute|min|minutes|hour|hours|day|days)"
+    r"|in|after|at|tomorrow|today|kal|aaj"
+    r"|am|pm|baje|subah|shaam|morning|evening"
+    r"|remind|yaad\s+dilana|alarm|set"
+    r"|me|mujhe|ko",
+    re.IGNORECASE | re.ASCII
+)
+_RE_WS = re.compile(r'\s+', re.ASCII)
+_RE_LEADING_PREP = re.compile(r'^(?:to|ki|ka|ke)\s+', re.IGNORECASE | re.ASCII)
 
 
 class TimeParser:
     """Parses natural language time expressions"""
     
-    def __init__(self):
-        # Time patterns for different languages
-        self.patterns = {
-            # Relative time patterns
-            "minutes": [
-                r"(\d+)\s*(?:minute|min|minutes)\s*(?:later|baad|mein)?",
-                r"(?:in|after)\s*(\d+)\s*(?:minute|min|minutes)",
-                r"(\d+)\s*(?:minute|min)\s*(?:baad|mein)"
-            ],
-            "hours": [
-                r"(\d+)\s*(?:hour|hours|ghante|ghanta)\s*(?:later|baad|mein)?",
-                r"(?:in|after)\s*(\d+)\s*(?:hour|hours)",
-                r"(\d+)\s*(?:ghante|ghanta)\s*(?:baad|mein)"
-            ],
-            "days": [
-                r"(\d+)\s*(?:day|days|din)\s*(?:later|baad|mein)?",
-                r"(?:in|after)\s*(\d+)\s*(?:day|days)",
-                r"(\d+)\s*din\s*(?:baad|mein)"
-            ],
-            # Specific time patterns
-            "time_today": [
-                r"(?:at|@)\s*(\d{1,2})(?::(\d{2}))?\s*(?:am|pm|AM|PM)?",
-                r"(\d{1,2})(?::(\d{2}))?\s*(?:am|pm|AM|PM)\s*(?:today|aaj)?",
-                r"(?:aaj|today)\s*(\d{1,2})(?::(\d{2}))?\s*(?:baje|am|pm)"
-            ],
-            # Tomorrow patterns
-            "tomorrow": [
-                r"(?:tomorrow|kal)\s*(?:at|@)?\s*(\d{1,2})(?::(\d{2}))?\s*(?:am|pm|AM|PM|baje)?",
-                r"kal\s*(?:subah|morning|shaam|evening)?\s*(\d{1,2})(?::(\d{2}))?\s*(?:baje|am|pm)?"
-            ],
-            # Day names
-            "weekdays": [
-                r"(?:next\s+)?(monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
-                r"(?:agle\s+)?(somwar|mangalwar|budhwar|gurwar|shukrwar|shaniwar|raviwar)"
-            ]
-        }
-        
-        # Day name mappings
-        self.day_names = {
-            "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-            "friday": 4, "saturday": 5, "sunday": 6,
-            "somwar": 0, "mangalwar": 1, "budhwar": 2, "gurwar": 3,
-            "shukrwar": 4, "shaniwar": 5, "raviwar": 6
-        }
-        
-        # Time keywords
-        self.time_keywords = {
-            "morning": (6, 0), "subah": (6, 0),
-            "afternoon": (14, 0), "dopahar": (14, 0),
-            "evening": (18, 0), "shaam": (18, 0),
-            "night": (21, 0), "raat": (21, 0)
-        }
+    # Time patterns for different languages - compiled once and shared by
+    # all instances, so constructing a parser allocates nothing
+    patterns = {
+        # Specific time patterns
+        "time_today": [
+            re.compile(r"(?:at|@)\s*(\d{1,2})(?::(\d{2}))?\s*(?:am|pm|AM|PM)?", re.ASCII),
+            re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(?:am|pm|AM|PM)\s*(?:today|aaj)?", re.ASCII),
+            re.compile(r"(?:aaj|today)\s*(\d{1,2})(?::(\d{2}))?\s*(?:baje|am|pm)", re.ASCII)
+        ],
+        # Tomorrow patterns
+        "tomorrow": [
+            re.compile(r"(?:tomorrow|kal)\s*(?:at|@)?\s*(\d{1,2})(?::(\d{2}))?\s*(?:am|pm|AM|PM|baje)?", re.ASCII),
+            re.compile(r"kal\s*(?:subah|morning|shaam|evening)?\s*(\d{1,2})(?::(\d{2}))?\s*(?:baje|am|pm)?", re.ASCII)
+        ]
+    }
+    
+    # Day name mappings
+    day_names = {
+        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+        "friday": 4, "saturday": 5, "sunday": 6,
+        "somwar": 0, "mangalwar": 1, "budhwar": 2, "gurwar": 3,
+        "shukrwar": 4, "shaniwar": 5, "raviwar": 6
+    }
+    # Any English or Hindi day name in a single search
+    _weekday_re = re.compile(
+        r"(?:(?:next|agle)\s+)?(" + "|".join(day_names) + ")",
+        re.IGNORECASE | re.ASCII
+    )
+    
+    # Time keywords
+    time_keywords = {
+        "morning": (6, 0), "subah": (6, 0),
+        "afternoon": (14, 0), "dopahar": (14, 0),
+        "evening": (18, 0), "shaam": (18, 0),
+        "night": (21, 0), "raat": (21, 0)
+    }
+    # All keywords in one alternation, so a single search finds any of them
+    _time_kw_re = re.compile("|".join(map(re.escape, time_keywords)), re.ASCII)
     
     def parse_time(self, text: str) -> Optional[datetime]:
         """Parse natural language time expression with fast fallback"""
+        current_time = datetime.now()
+        
         # Try fast pattern matching first
-        result = self._parse_time_fallback(text)
+        result = self._parse_time_fallback(text, current_time)
         if result:
             return result
         
         # Only use AI for complex cases
         try:
-            current_time = datetime.now()
-            
             # Simplified AI prompt for speed
-            prompt = f"""Time now: {current_time.strftime('%H:%M')}. Parse: "{text}". Format: YYYY-MM-DD HH:MM:SS or NONE"""
+            prompt = _PARSE_PROMPT.format_map({"now": current_time.strftime('%H:%M'), "text": text})
 
-            # Import AI client
-            import sys
-            from pathlib import Path
-            sys.path.append(str(Path(__file__).parent.parent.parent / "legacy_code"))
-            from .genai_client import make_client
-            
-            client = make_client()
+            client = _get_client()
             response = client.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=prompt
@@ -106,121 +208,113 @@ class TimeParser:
         except Exception:
             return None
     
-    def _parse_time_fallback(self, text: str) -> Optional[datetime]:
+    def _parse_time_fallback(self, text: str, now: datetime) -> Optional[datetime]:
         """Fast fallback time parsing"""
-        now = datetime.now()
-        text_lower = text.lower()
+        offset = self._fallback_offset(text.lower())
+        if offset is None:
+            return None
+        try:
+            return now + offset
+        except OverflowError:
+            return None
+    
+    @staticmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def _fallback_offset(text_lower: str) -> Optional[timedelta]:
+        """
+        Offset from now matched by the fast fallback patterns (memoized)
         
-        import re
+        Returns a timedelta rather than a datetime, so cached results stay
+        valid as the clock moves (ASR retries repeat the same phrase).
+        """
+        # Every minute pattern needs "min" and the hour pattern needs
+        # "hour"/"ghante", so plain substring checks let the common no-time
+        # message skip the regex engine entirely
         
         # Handle common Hindi/Hinglish patterns quickly
-        # "2 min baad", "5 minute mein", etc.
-        patterns = [
-            (r'(\d+)\s*min(?:ute)?\s*(?:baad|mein|later)', lambda m: int(m.group(1))),
-            (r'(?:do|two)\s*min(?:ute)?\s*(?:baad|mein)', lambda m: 2),
-            (r'(?:teen|three)\s*min(?:ute)?\s*(?:baad|mein)', lambda m: 3),
-            (r'(?:char|four)\s*min(?:ute)?\s*(?:baad|mein)', lambda m: 4),
-            (r'(?:paanch|five)\s*min(?:ute)?\s*(?:baad|mein)', lambda m: 5),
-        ]
-        
-        for pattern, extract_func in patterns:
-            match = re.search(pattern, text_lower)
+        if "min" in text_lower:
+            match = _RE_FALLBACK_MINUTES.search(text_lower)
             if match:
+                digits = match.group(1)
+                minutes = int(digits) if digits else _WORD2N[match.group(2)]
                 try:
-                    minutes = extract_func(match)
-                    return now + timedelta(minutes=minutes)
-                except:
-                    continue
+                    return timedelta(minutes=minutes)
+                except OverflowError:
+                    pass
         
         # Handle hours
-        hour_match = re.search(r'(\d+)\s*(?:hour|ghante)', text_lower)
-        if hour_match:
-            try:
-                hours = int(hour_match.group(1))
-                return now + timedelta(hours=hours)
-            except:
-                pass
+        if "hour" in text_lower or "ghante" in text_lower:
+            hour_match = _RE_FALLBACK_HOURS.search(text_lower)
+            if hour_match:
+                try:
+                    return timedelta(hours=int(hour_match.group(1)))
+                except OverflowError:
+                    pass
         
         # Handle tomorrow
         if "tomorrow" in text_lower or "kal" in text_lower:
-            return now + timedelta(days=1)
+            return timedelta(days=1)
         
         return None
     
-    def _parse_relative_time(self, text: str) -> Optional[datetime]:
+    def _parse_relative_time(self, text: str, now: datetime) -> Optional[datetime]:
         """Parse relative time expressions like 'in 5 minutes'"""
-        now = datetime.now()
-        
-        # Minutes
-        for pattern in self.patterns["minutes"]:
-            match = re.search(pattern, text)
+        for pattern, unit in _REL_UNITS:
+            match = pattern.search(text)
             if match:
-                minutes = int(match.group(1))
-                return now + timedelta(minutes=minutes)
-        
-        # Hours
-        for pattern in self.patterns["hours"]:
-            match = re.search(pattern, text)
-            if match:
-                hours = int(match.group(1))
-                return now + timedelta(hours=hours)
-        
-        # Days
-        for pattern in self.patterns["days"]:
-            match = re.search(pattern, text)
-            if match:
-                days = int(match.group(1))
-                return now + timedelta(days=days)
+                return now + timedelta(**{unit: int(match.group(1))})
         
         return None
     
-    def _parse_specific_time(self, text: str) -> Optional[datetime]:
+    def _parse_specific_time(self, text: str, now: datetime) -> Optional[datetime]:
         """Parse specific time today like 'at 3 PM'"""
-        today = datetime.now().date()
+        text_lower = text.lower()
+        today = now.date()
         
         for pattern in self.patterns["time_today"]:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 hour = int(match.group(1))
                 minute = int(match.group(2)) if match.group(2) else 0
                 
                 # Handle AM/PM
-                if "pm" in text.lower() and hour != 12:
+                if "pm" in text_lower and hour != 12:
                     hour += 12
-                elif "am" in text.lower() and hour == 12:
+                elif "am" in text_lower and hour == 12:
                     hour = 0
-                elif "baje" in text and hour < 12 and ("shaam" in text or "evening" in text):
+                elif "baje" in text_lower and hour < 12 and ("shaam" in text_lower or "evening" in text_lower):
                     hour += 12
                 
                 target_time = datetime.combine(today, time(hour, minute))
                 
                 # If time has passed today, schedule for tomorrow
-                if target_time <= datetime.now():
+                if target_time <= now:
                     target_time += timedelta(days=1)
                 
                 return target_time
         
         return None
     
-    def _parse_tomorrow(self, text: str) -> Optional[datetime]:
+    def _parse_tomorrow(self, text: str, now: datetime) -> Optional[datetime]:
         """Parse tomorrow time expressions"""
-        tomorrow = datetime.now().date() + timedelta(days=1)
+        text_lower = text.lower()
+        tomorrow = now.date() + timedelta(days=1)
         
         for pattern in self.patterns["tomorrow"]:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 hour = int(match.group(1))
                 minute = int(match.group(2)) if match.group(2) else 0
                 
                 # Handle AM/PM and Hindi time expressions
-                if "pm" in text.lower() and hour != 12:
+                if "pm" in text_lower and hour != 12:
                     hour += 12
-                elif "am" in text.lower() and hour == 12:
+                elif "am" in text_lower and hour == 12:
                     hour = 0
-                elif "baje" in text:
-                    if "subah" in text or "morning" in text:
+                elif "baje" in text_lower:
+                    if "subah" in text_lower or "morning" in text_lower:
                         pass  # Keep as is for morning
-                    elif "shaam" in text or "evening" in text:
+                    elif "shaam" in text_lower or "evening" in text_lower:
                         if hour < 12:
                             hour += 12
                 
@@ -228,40 +322,35 @@ class TimeParser:
         
         return None
     
-    def _parse_weekday(self, text: str) -> Optional[datetime]:
+    def _parse_weekday(self, text: str, now: datetime) -> Optional[datetime]:
         """Parse weekday expressions like 'next Monday'"""
-        for pattern in self.patterns["weekdays"]:
-            match = re.search(pattern, text)
-            if match:
-                day_name = match.group(1).lower()
-                if day_name in self.day_names:
-                    target_weekday = self.day_names[day_name]
-                    return self._get_next_weekday(target_weekday)
+        match = self._weekday_re.search(text)
+        if not match:
+            return None
         
-        return None
+        return self._get_next_weekday(self.day_names[match.group(1).lower()], now)
     
-    def _parse_time_keywords(self, text: str) -> Optional[datetime]:
+    def _parse_time_keywords(self, text: str, now: datetime) -> Optional[datetime]:
         """Parse time keywords like 'tomorrow morning'"""
-        for keyword, (hour, minute) in self.time_keywords.items():
-            if keyword in text:
-                if "tomorrow" in text or "kal" in text:
-                    tomorrow = datetime.now().date() + timedelta(days=1)
-                    return datetime.combine(tomorrow, time(hour, minute))
-                else:
-                    today = datetime.now().date()
-                    target_time = datetime.combine(today, time(hour, minute))
-                    
-                    # If time has passed, schedule for tomorrow
-                    if target_time <= datetime.now():
-                        target_time += timedelta(days=1)
-                    
-                    return target_time
+        match = self._time_kw_re.search(text)
+        if not match:
+            return None
         
-        return None
+        hour, minute = self.time_keywords[match.group(0)]
+        today = now.date()
+        if "tomorrow" in text or "kal" in text:
+            return datetime.combine(today + timedelta(days=1), time(hour, minute))
+        else:
+            target_time = datetime.combine(today, time(hour, minute))
+            
+            # If time has passed, schedule for tomorrow
+            if target_time <= now:
+                target_time += timedelta(days=1)
+            
+            return target_time
     
-    def _get_next_weekday(self, target_weekday: int) -> datetime:
+    def _get_next_weekday(self, target_weekday: int, today: datetime) -> datetime:
         """Get next occurrence of a weekday"""
-        today = datetime.now()
         days_ahead = target_weekday - today.weekday()
         
         if days_ahead <= 0:  # Target day already happened this week
@@ -270,126 +359,74 @@ class TimeParser:
         target_date = today + timedelta(days=days_ahead)
         return target_date.replace(hour=9, minute=0, second=0, microsecond=0)  # Default to 9 AM
     
-    def _extract_task_fast(self, text: str) -> Tuple[Optional[str], Optional[datetime]]:
+    def _extract_task_fast(self, text: str, now: datetime) -> Tuple[Optional[str], Optional[datetime]]:
         """Fast extraction for common reminder patterns"""
-        now = datetime.now()
-        text_lower = text.lower()
+        task, minutes = self._extract_task_offset(text.lower())
+        if task:
+            try:
+                return task, now + timedelta(minutes=minutes)
+            except OverflowError:
+                pass
+        
+        return None, None
+    
+    @staticmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def _extract_task_offset(text_lower: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Task and minutes-from-now for a reminder (memoized)
         
+        Returns:
+            (task, minutes) or (None, None) if the fast patterns don't apply
+        """
         # Try to extract minutes first
-        time_match = re.search(r'(\d+)\s*min(?:ute)?s?', text_lower)
+        time_match = _RE_TASK_MINUTES.search(text_lower)
+        if not time_match:
+            return None, None
         
-        if time_match:
-            try:
-                minutes = int(time_match.group(1))
-                trigger_time = now + timedelta(minutes=minutes)
-                
-                # Extract task - find what comes AFTER the time + reminder keywords
-                # Pattern: "[time] [reminder words] TASK"
-                # Examples: 
-                #   "2 minutes remind me that I have to eat" -> "eat"
-                #   "in 2 minutes can you remind me that I have to eat" -> "eat"
-                
-                # First, remove everything before and including the time reference
-                parts = text_lower.split(time_match.group(0), 1)
-                if len(parts) > 1:
-                    after_time = parts[1].strip()
-                    
-                    # Remove reminder-related phrases in order of specificity
-                    reminder_phrases = [
-                        "can you remind me that i have to",
-                        "can you remind me to",
-                        "can you remind me that",
-                        "remind me that i have to",
-                        "remind me i have to",
-                        "remind me to",
-                        "remind me that",
-                        "yaad dilana ki",
-                        "yaad dilana",
-                    ]
-                    
-                    task = after_time
-                    for phrase in reminder_phrases:
-                        if phrase in task:
-                            # Split at this phrase and take what comes after
-                            split_parts = task.split(phrase, 1)
-                            if len(split_parts) > 1:
-                                task = split_parts[1].strip()
-                                break
-                    
-                    # Remove leading filler words
-                    filler_words = ["that", "to", "ki", "can", "you"]
-                    while task:
-                        stripped = False
-                        for word in filler_words:
-                            if task.startswith(word + " "):
-                                task = task[len(word):].strip()
-                                stripped = True
-                                break
-                        if not stripped:
-                            break
-                    
-                    # Check for common specific tasks
-                    if "eat" in task or "lunch" in task or "khana" in task:
-                        task = "eat" if "eat" in task else ("lunch" if "lunch" in task else "khana khana")
-                    elif "sleep" in task or "so" in task:
-                        task = "sleep"
-                    elif "call" in task:
-                        task = "call"
-                    elif "meeting" in task:
-                        task = "meeting"
-                    
-                    if task and len(task) > 1:  # Ensure task is meaningful
-                        return task, trigger_time
-            except:
-                pass
+        minutes = int(time_match.group(1))
+        
+        # Extract task - find what comes AFTER the time + reminder keywords
+        # Pattern: "[time] [reminder words] TASK"
+        # Examples: 
+        #   "2 minutes remind me that I have to eat" -> "eat"
+        #   "in 2 minutes can you remind me that I have to eat" -> "eat"
+        
+        # First, remove everything before and including the time reference
+        parts = text_lower.split(time_match.group(0), 1)
+        if len(parts) > 1:
+            after_time = parts[1].strip()
+            
+            # Remove reminder-related phrases and whatever precedes them
+            task = _RE_REMINDER_PREFIX.sub("", after_time, count=1)
+            
+            # Remove leading filler words
+            task = _RE_FILLER.sub("", task, count=1)
+            
+            # Check for common specific tasks
+            task = next((canon for kw, canon in _TASK_CANON.items() if kw in task), task)
+            
+            if task and len(task) > 1:  # Ensure task is meaningful
+                return task, minutes
         
         return None, None
     
     def extract_task_from_reminder(self, text: str) -> Tuple[Optional[str], Optional[datetime]]:
         """Extract both task and time from reminder text - FAST with fallback"""
+        current_time = datetime.now()
         
         # FAST PATH: Try simple regex patterns first
-        fast_result = self._extract_task_fast(text)
+        fast_result = self._extract_task_fast(text, current_time)
         if fast_result[0] and fast_result[1]:
             return fast_result
         
         # AI PATH: Use AI only if fast path fails
         try:
-            current_time = datetime.now()
-            
-            prompt = f"""Extract task and time from reminder request.
-
-Current time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}
-
-Input: "{text}"
-
-Examples:
-- "Remind me in 5 minutes to call John" → Task: "call John", Time: [5 min from now]
-- "set timer 2 minutes I have to sleep" → Task: "sleep", Time: [2 min from now]
-- "5 minute baad yaad dilana medicine" → Task: "medicine", Time: [5 min from now]
-- "2 min mein khana khana" → Task: "khana khana", Time: [2 min from now]
-
-Hindi numbers: do=2, teen=3, char=4, paanch=5
-"baad"/"mein" means "after"/"in"
-"yaad dilana" means "remind"
-
-Calculate exact time from current: {current_time}
-
-Respond in this exact format:
-TASK: [extracted task]
-TIME: YYYY-MM-DD HH:MM:SS
-
-If no valid task or time can be extracted, respond with:
-TASK: NONE
-TIME: NONE"""
+            prompt = _EXTRACT_PROMPT.format_map(
+                {"now": current_time.strftime('%Y-%m-%d %H:%M:%S'), "text": text}
+            )
 
-            # Import AI client
-            import sys
-            from pathlib import Path
-            sys.path.append(str(Path(__file__).parent.parent.parent / "legacy_code"))
-            from .genai_client import make_client
-            
-            client = make_client()
+            client = _get_client()
             response = client.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=prompt
@@ -426,49 +463,24 @@ TIME: NONE"""
     
     def _clean_task_text(self, text: str) -> str:
         """Clean task text by removing time-related words"""
-        # Words to remove from task description
-        time_words = [
-            r"\d+\s*(?:minute|min|minutes|hour|hours|day|days)",
-            r"(?:in|after|at|tomorrow|today|kal|aaj)",
-            r"(?:am|pm|baje|subah|shaam|morning|evening)",
-            r"(?:remind|yaad\s+dilana|alarm|set)",
-            r"(?:me|mujhe|ko)"
-        ]
-        
-        cleaned = text
-        for word_pattern in time_words:
-            cleaned = re.sub(word_pattern, "", cleaned, flags=re.IGNORECASE)
+        cleaned = _RE_CLEAN_TASK.sub("", text)
         
         # Clean up extra spaces and common words
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = re.sub(r'^(?:to|ki|ka|ke)\s+', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _RE_WS.sub(' ', cleaned).strip()
+        cleaned = _RE_LEADING_PREP.sub('', cleaned)
         
         return cleaned if cleaned else "reminder"
     
     def format_time_naturally(self, dt: datetime, language: str = "hinglish") -> str:
         """Format datetime in natural language"""
-        now = datetime.now()
-        diff = dt - now
+        diff = dt - datetime.now()
+        
+        if diff.days == 0:
+            branch = "minutes" if diff.seconds < 3600 else "today"  # Less than 1 hour
+        elif diff.days == 1:
+            branch = "tomorrow"
+        else:
+            branch = "later"
         
-        if language.lower() == "english":
-            if diff.days == 0:
-                if diff.seconds < 3600:  # Less than 1 hour
-                    minutes = diff.seconds // 60
-                    return f"in {minutes} minutes"
-                else:
-                    return f"at {dt.strftime('%I:%M %p')} today"
-            elif diff.days == 1:
-                return f"tomorrow at {dt.strftime('%I:%M %p')}"
-            else:
-                return f"on {dt.strftime('%A, %B %d at %I:%M %p')}"
-        else:  # Hinglish
-            if diff.days == 0:
-                if diff.seconds < 3600:
-                    minutes = diff.seconds // 60
-                    return f"{minutes} minute mein"
-                else:
-                    return f"aaj {dt.strftime('%I:%M')} baje"
-            elif diff.days == 1:
-                return f"kal {dt.strftime('%I:%M')} baje"
-            else:
-                return f"{dt.strftime('%A')} ko {dt.strftime('%I:%M')} baje"
+        lang = "english" if language.lower() == "english" else "hinglish"
+        return _NATURAL_FORMATS[lang, branch].format(m=diff.seconds // 60, dt=dt)
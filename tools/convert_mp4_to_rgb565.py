@@ -24,60 +24,358 @@ Output Structure:
 
 Requirements:
     pip install opencv-python numpy tqdm
+    pip install numba   # optional, only used if OpenCV lacks BGR565 conversion
+
+    NumPy is always present (OpenCV's Python bindings are built on it), so
+    every RGB565 path is vectorized; there is no pure-Python pixel loop.
 
 Author: Microbot Project
 """
 
+import io
 import os
 import sys
 import argparse
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 import cv2
 import numpy as np
 from pathlib import Path
 from tqdm import tqdm
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configuration
 TARGET_WIDTH = 240   # TFT display width (use 120 for half res)
 TARGET_HEIGHT = 320  # TFT display height (use 160 for half res)
 TARGET_FPS = 15      # Target framerate (10-20 recommended)
 
+# Clips converted in parallel by default: half the cores, leaving the rest
+# for OpenCV's own threads
+DEFAULT_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# Downscale factor above which frames are resized with INTER_AREA
+AREA_MIN_SCALE = 2.0
+
+# --fast-seek: smallest frame skip that seeks between kept frames instead of
+# grabbing through them (typical H.264 GOPs are 12-30 frames)
+FAST_SEEK_MIN_SKIP = 12
+
+# Frames buffered between conversion pipeline stages
+PIPELINE_DEPTH = 16
+
+# Frames packed per RGB565 kernel call, amortizing per-call overhead at
+# small frame sizes
+FRAME_BATCH = 16
+_END_OF_STREAM = None
+
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.2
+
+# .bin write buffer: frames are streamed to disk, batched into large writes
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Per-channel RGB565 lookup tables: each 8-bit value already masked and
+# shifted to its final bit position
+_LEVELS = np.arange(256, dtype=np.uint16)
+R_LUT = (_LEVELS & 0xF8) << 8
+G_LUT = (_LEVELS & 0xFC) << 3
+B_LUT = _LEVELS >> 3
+
+# Packed output pixel: RGB565 stored low byte first
+RGB565_DTYPE = np.dtype('<u2')
+
+# OpenCV builds with the native RGB565 conversion
+OPENCV_RGB565 = hasattr(cv2, "COLOR_BGR2BGR565")
+
+
+def pack_rgb565(bgr, out=None):
+    """
+    Pack (..., H, W, 3) uint8 BGR images into RGB565 (little endian for ESP32)
+    
+    Vectorized over the whole frame: RRRRRGGG GGGBBBBB per pixel, low byte first.
+    Channels are read straight from OpenCV's BGR order, so no BGR->RGB pass is needed,
+    and each one is mapped through its LUT instead of cast/mask/shift arithmetic.
+    
+    Args:
+        bgr: (..., H, W, 3) uint8 frame or stack of frames
+        out: Optional (..., H, W) '<u2' array to pack into
+    
+    Returns:
+        (..., H, W) little-endian uint16 array of RGB565 pixels
+    """
+    if out is None:
+        out = np.empty(bgr.shape[:-1], dtype=RGB565_DTYPE)
+    np.bitwise_or(R_LUT[bgr[..., 2]], G_LUT[bgr[..., 1]], out=out)
+    np.bitwise_or(out, B_LUT[bgr[..., 0]], out=out)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _pack_rgb565_jit(bgr, out):
+        """Fused single-pass RGB565 packing of a BGR frame (rows in parallel)"""
+        height, width = out.shape
+        for y in prange(height):
+            for x in range(width):
+                b = np.uint16(bgr[y, x, 0])
+                g = np.uint16(bgr[y, x, 1])
+                r = np.uint16(bgr[y, x, 2])
+                out[y, x] = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+    def _make_pack_kernel(width):
+        """
+        Build the pack kernel with the row width baked in as a constant
+        
+        With a fixed inner trip count LLVM fully vectorizes/unrolls the row
+        loop. Compiled on first use; closures can't use Numba's disk cache.
+        """
+        @njit(parallel=True, fastmath=True)
+        def pack(bgr, out):
+            for y in prange(out.shape[0]):
+                for x in range(width):
+                    b = np.uint16(bgr[y, x, 0])
+                    g = np.uint16(bgr[y, x, 1])
+                    r = np.uint16(bgr[y, x, 2])
+                    out[y, x] = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return pack
 
-def rgb888_to_rgb565(r, g, b):
-    """Convert RGB888 to RGB565 (little endian for ESP32)"""
-    # RGB565: RRRRRGGG GGGBBBBB
-    r5 = (r >> 3) & 0x1F
-    g6 = (g >> 2) & 0x3F
-    b5 = (b >> 3) & 0x1F
-    rgb565 = (r5 << 11) | (g6 << 5) | b5
-    # Return as little endian (low byte first)
-    return rgb565 & 0xFF, (rgb565 >> 8) & 0xFF
+    # Specialized kernels for the display widths this tool targets
+    # (120x160 half res, 128x160, 240x320 full res); others use the generic one
+    _PACK_KERNELS = {width: _make_pack_kernel(width) for width in (120, 128, 240)}
 
 
-def convert_frame_to_rgb565(frame, target_width, target_height):
-    """Convert a video frame to RGB565 binary data"""
+def convert_frame_to_rgb565(frame, target_width, target_height, interpolation=cv2.INTER_AREA,
+                            out=None, resized=None):
+    """
+    Convert a video frame to RGB565 binary data
+    
+    Args:
+        frame: BGR frame from OpenCV
+        target_width: Output width
+        target_height: Output height
+        interpolation: cv2 resize filter
+        out: Optional (H, W) RGB565_DTYPE array to pack into (reused across frames)
+        resized: Optional (H, W, 3) uint8 scratch buffer for the resized frame
+    
+    Returns:
+        (H, W) little-endian uint16 array; it exposes the buffer protocol, so it
+        can be written to the .bin file as-is
+    """
     # Resize frame to target dimensions
-    resized = cv2.resize(frame, (target_width, target_height), interpolation=cv2.INTER_AREA)
+    resized = cv2.resize(frame, (target_width, target_height), dst=resized, interpolation=interpolation)
     
-    # Convert BGR to RGB
-    rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+    if out is None:
+        out = np.empty((target_height, target_width), dtype=RGB565_DTYPE)
     
-    # Convert to RGB565 binary
-    binary_data = bytearray()
-    for y in range(target_height):
-        for x in range(target_width):
-            r, g, b = rgb[y, x]
-            low, high = rgb888_to_rgb565(r, g, b)
-            binary_data.append(low)
-            binary_data.append(high)
-    
-    return bytes(binary_data)
+    return pack_frames_rgb565(resized, out)
+
+
+def pack_frames_rgb565(bgr, out):
+    """
+    Pack one frame or a stack of frames into RGB565 in a single kernel call
+    
+    Args:
+        bgr: (..., H, W, 3) uint8 BGR frames (C-contiguous)
+        out: (..., H, W) RGB565_DTYPE array to pack into
+    
+    Returns:
+        out
+    """
+    width = bgr.shape[-2]
+    
+    # Convert to RGB565 binary in OpenCV's SIMD kernel: BGR2BGR565 on BGR input
+    # packs R high / B low, stored as little-endian uint16 - the same bytes
+    # pack_rgb565 produces. The conversion is per pixel, so a stack of frames
+    # is converted as one tall image. This is OpenCV's hand-vectorized C++
+    # (SSE2/AVX2 on x86, NEON on ARM) with no temporaries, which is why the
+    # tool ships no compiled pack extension of its own.
+    if OPENCV_RGB565:
+        cv2.cvtColor(bgr.reshape(-1, width, 3), cv2.COLOR_BGR2BGR565,
+                     dst=_as_bytes_view(out.reshape(-1, width)))
+        return out
+    
+    # Fallback: fused Numba kernel, else NumPy
+    if NUMBA_AVAILABLE:
+        kernel = _PACK_KERNELS.get(width, _pack_rgb565_jit)
+        kernel(bgr.reshape(-1, width, 3), out.reshape(-1, width))
+        return out
+    return pack_rgb565(bgr, out)
+
+
+def _as_bytes_view(rgb565):
+    """(H, W) uint16 buffer viewed as the (H, W, 2) uint8 image OpenCV writes RGB565 into"""
+    return rgb565.view(np.uint8).reshape(rgb565.shape + (2,))
+
+
+def open_capture(input_path):
+    """Open a video, asking FFmpeg for hardware-accelerated decoding where the build supports it"""
+    try:
+        cap = cv2.VideoCapture(str(input_path), cv2.CAP_FFMPEG,
+                               [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+        if cap.isOpened():
+            return cap
+    except (AttributeError, cv2.error):
+        # OpenCV < 4.5 (no HW acceleration properties) or no FFmpeg backend
+        pass
+    return cv2.VideoCapture(str(input_path))
+
+
+def _backend_name(cap):
+    """Name of the capture's backend, or "" if OpenCV can't report it"""
+    try:
+        return cap.getBackendName()
+    except (AttributeError, cv2.error):
+        return ""
+
+
+def cuda_available():
+    """Check for an OpenCV build with CUDA video decoding and a usable GPU"""
+    try:
+        return hasattr(cv2, "cudacodec") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+def _drain(q, free_q=None):
+    """Discard queued items up to the end-of-stream marker, recycling buffers into free_q"""
+    while True:
+        item = q.get()
+        if item is _END_OF_STREAM:
+            break
+        if free_q is not None:
+            free_q.put(item[0])
+
 
+def _decode_frames(cap, frame_skip, decoded_q, stop, errors, fast_seek=False):
+    """
+    Pipeline reader stage: decode the frames kept for the target FPS
+    
+    With fast_seek, jumps straight to the next kept frame instead of grabbing
+    the ones in between; FFmpeg then only decodes from the preceding keyframe.
+    """
+    try:
+        frame_index = 0
+        while not stop.is_set():
+            if not cap.grab():
+                break
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+            decoded_q.put(frame)
+            
+            if fast_seek:
+                frame_index += frame_skip
+                if not cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index):
+                    break
+                continue
+            
+            # Skip frames to achieve target FPS. grab() only demuxes/decodes,
+            # so skipped frames never pay for the pixel conversion retrieve()
+            # does; at EOF the next grab() above fails too
+            for _ in range(frame_skip - 1):
+                if not cap.grab():
+                    break
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        decoded_q.put(_END_OF_STREAM)
 
-def convert_video(input_path, output_bin_path, output_manifest_path, target_width, target_height, target_fps):
+
+def _encode_frames(decoded_q, encoded_q, free_q, stop, errors, target_width, target_height, interpolation):
+    """
+    Pipeline worker stage: resize decoded frames into a batch and pack it to RGB565
+    
+    Emits (buffer, frame count) pairs; buffers come from free_q.
+    """
+    finished = False
+    try:
+        # Only this thread touches the resize batch
+        batch = np.empty((FRAME_BATCH, target_height, target_width, 3), dtype=np.uint8)
+        count = 0
+        while True:
+            frame = decoded_q.get()
+            if frame is _END_OF_STREAM:
+                finished = True
+                break
+            if stop.is_set():
+                continue
+            
+            cv2.resize(frame, (target_width, target_height), dst=batch[count], interpolation=interpolation)
+            count += 1
+            if count == FRAME_BATCH:
+                encoded_q.put((pack_frames_rgb565(batch, free_q.get()), count))
+                count = 0
+        
+        if count and not stop.is_set():
+            out = free_q.get()
+            pack_frames_rgb565(batch[:count], out[:count])
+            encoded_q.put((out, count))
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+        # Unblock the reader so it can finish
+        if not finished:
+            _drain(decoded_q)
+    finally:
+        encoded_q.put(_END_OF_STREAM)
+
+
+def _decode_frames_gpu(input_path, frame_skip, encoded_q, free_q, stop, errors,
+                       target_width, target_height, interpolation):
+    """
+    Pipeline stage for --gpu: decode (NVDEC), resize and pack RGB565 on the GPU
+    
+    Only the packed target-size frame is copied back to the host, into
+    batches taken from free_q, so this stage feeds the writer directly.
+    """
+    try:
+        reader = cv2.cudacodec.createVideoReader(str(input_path))
+        out = None
+        count = 0
+        frame_index = 0
+        while not stop.is_set():
+            ret, gpu_frame = reader.nextFrame()  # BGRA
+            if not ret:
+                break
+            
+            # Skip frames to achieve target FPS
+            if frame_index % frame_skip == 0:
+                resized = cv2.cuda.resize(gpu_frame, (target_width, target_height), interpolation=interpolation)
+                rgb565 = cv2.cuda.cvtColor(resized, cv2.COLOR_BGRA2BGR565)
+                if out is None:
+                    out = free_q.get()
+                rgb565.download(_as_bytes_view(out[count]))
+                count += 1
+                if count == FRAME_BATCH:
+                    encoded_q.put((out, count))
+                    out = None
+                    count = 0
+            
+            frame_index += 1
+        
+        if count and not stop.is_set():
+            encoded_q.put((out, count))
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        encoded_q.put(_END_OF_STREAM)
+
+
+def convert_video(input_path, output_bin_path, output_manifest_path, target_width, target_height, target_fps,
+                  show_progress=True, use_gpu=False, fast_seek=False):
     """Convert a single MP4 file to RGB565 binary format"""
     
     # Open video
-    cap = cv2.VideoCapture(str(input_path))
+    cap = open_capture(input_path)
     if not cap.isOpened():
         print(f"    ❌ Could not open: {input_path}")
         return False
@@ -92,36 +390,96 @@ def convert_video(input_path, output_bin_path, output_manifest_path, target_widt
     frame_skip = max(1, int(original_fps / target_fps))
     expected_frames = total_frames // frame_skip
     
-    print(f"    Original: {original_width}x{original_height} @ {original_fps:.1f}fps, {total_frames} frames")
-    print(f"    Target:   {target_width}x{target_height} @ {target_fps}fps, ~{expected_frames} frames")
+    # Frame size is fixed per clip, so pick the resize filter once: INTER_AREA
+    # only pays off for strong downscales, INTER_LINEAR is much faster otherwise
+    scale = max(original_width / target_width, original_height / target_height)
+    interpolation = cv2.INTER_AREA if scale > AREA_MIN_SCALE else cv2.INTER_LINEAR
     
-    # Convert frames
-    binary_data = bytearray()
-    frame_count = 0
-    frame_index = 0
-    
-    pbar = tqdm(total=expected_frames, desc="    Converting", unit="frame")
+    # Seeking only beats grabbing when it skips past whole GOPs, and only
+    # FFmpeg seeks by frame reliably
+    fast_seek = fast_seek and frame_skip >= FAST_SEEK_MIN_SKIP and _backend_name(cap) == "FFMPEG"
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        
-        # Skip frames to achieve target FPS
-        if frame_index % frame_skip == 0:
-            frame_rgb565 = convert_frame_to_rgb565(frame, target_width, target_height)
-            binary_data.extend(frame_rgb565)
-            frame_count += 1
-            pbar.update(1)
-        
-        frame_index += 1
+    print(f"    Original: {original_width}x{original_height} @ {original_fps:.1f}fps, {total_frames} frames")
+    print(f"    Target:   {target_width}x{target_height} @ {target_fps}fps, ~{expected_frames} frames")
     
-    pbar.close()
-    cap.release()
+    # Convert frames: reader thread (decode) -> worker thread (RGB565) ->
+    # this thread (write). OpenCV and file I/O release the GIL, so the
+    # stages overlap; bounded queues keep at most PIPELINE_DEPTH frames in
+    # flight per stage. Each stage is a single thread, so frame order is kept.
+    decoded_q = queue.Queue(maxsize=PIPELINE_DEPTH)
+    encoded_q = queue.Queue(maxsize=max(1, PIPELINE_DEPTH // FRAME_BATCH))
+    stop = threading.Event()
+    errors = []
+    
+    # Output batches cycle through a fixed set of buffers: one per queue slot,
+    # plus the one being filled and the one being written
+    free_q = queue.Queue()
+    for _ in range(encoded_q.maxsize + 2):
+        free_q.put(np.empty((FRAME_BATCH, target_height, target_width), dtype=RGB565_DTYPE))
+    
+    if use_gpu:
+        # The GPU stage decodes and converts; the capture only supplied metadata
+        cap.release()
+        stages = [
+            threading.Thread(target=_decode_frames_gpu,
+                             args=(input_path, frame_skip, encoded_q, free_q, stop, errors,
+                                   target_width, target_height, interpolation),
+                             daemon=True),
+        ]
+    else:
+        stages = [
+            threading.Thread(target=_decode_frames, args=(cap, frame_skip, decoded_q, stop, errors, fast_seek),
+                             daemon=True),
+            threading.Thread(target=_encode_frames,
+                             args=(decoded_q, encoded_q, free_q, stop, errors,
+                                   target_width, target_height, interpolation),
+                             daemon=True),
+        ]
+    for stage in stages:
+        stage.start()
     
-    # Write binary file
-    with open(output_bin_path, 'wb') as f:
-        f.write(binary_data)
+    frame_count = 0
+    file_size = 0
+    finished = False
+    # Updated once per batch, redrawn at most every PROGRESS_INTERVAL seconds
+    pbar = tqdm(total=expected_frames, desc="    Converting", unit="frame", disable=not show_progress,
+                mininterval=PROGRESS_INTERVAL)
+    
+    failed = True
+    try:
+        with open(output_bin_path, 'wb', buffering=WRITE_BUFFER_BYTES) as f:
+            while True:
+                item = encoded_q.get()
+                if item is _END_OF_STREAM:
+                    finished = True
+                    break
+                batch, count = item
+                f.write(batch[:count])
+                free_q.put(batch)
+                frame_count += count
+                pbar.update(count)
+            file_size = f.tell()
+        failed = False
+    except BaseException:
+        # Unblock the worker so every stage can shut down
+        stop.set()
+        if not finished:
+            _drain(encoded_q, free_q)
+        raise
+    finally:
+        for stage in stages:
+            stage.join()
+        pbar.close()
+        cap.release()
+        if failed or errors:
+            # Don't leave a truncated .bin behind that looks like a finished clip
+            try:
+                output_bin_path.unlink()
+            except OSError:
+                pass
+    
+    if errors:
+        raise errors[0]
     
     # Write manifest file
     with open(output_manifest_path, 'w') as f:
@@ -132,7 +490,7 @@ def convert_video(input_path, output_bin_path, output_manifest_path, target_widt
         f.write(f"frames={frame_count}\n")
         f.write(f"loop=1\n")
     
-    file_size_mb = len(binary_data) / (1024 * 1024)
+    file_size_mb = file_size / (1024 * 1024)
     frame_size_kb = (target_width * target_height * 2) / 1024
     
     print(f"    ✅ Saved: {output_bin_path.name} ({file_size_mb:.2f} MB, {frame_count} frames)")
@@ -141,7 +499,58 @@ def convert_video(input_path, output_bin_path, output_manifest_path, target_widt
     return True
 
 
-def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, target_height=TARGET_HEIGHT, target_fps=TARGET_FPS):
+def _convert_job(args, options):
+    """
+    Run convert_video in a worker process
+    
+    Returns:
+        (success, captured output) so the parent can print each clip's log
+        as one block instead of interleaving workers
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        ok = convert_video(*args, show_progress=False, **options)
+    return ok, log.getvalue()
+
+
+def _init_worker(jobs):
+    """Worker process initializer: split the cores between the parallel jobs' OpenCV thread pools"""
+    cv2.setNumThreads(max(1, (os.cpu_count() or 1) // jobs))
+
+
+def _convert_serial(tasks, options):
+    """Convert clips one at a time in this process, with live progress bars; yields success flags"""
+    for rel_path, args in tasks:
+        print(f"📹 {rel_path}")
+        try:
+            yield convert_video(*args, **options)
+        except Exception as e:
+            print(f"    ❌ Conversion failed: {e}")
+            yield False
+
+
+def _convert_parallel(tasks, options, jobs):
+    """
+    Convert clips in a pool of worker processes; yields success flags as clips finish
+    
+    Each worker has its own GIL and its own VideoCapture and writes its own
+    output files, so no frame data crosses process boundaries.
+    """
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(jobs,)) as executor:
+        futures = {executor.submit(_convert_job, args, options): rel_path for rel_path, args in tasks}
+        
+        for future in as_completed(futures):
+            print(f"📹 {futures[future]}")
+            try:
+                ok, log = future.result()
+            except Exception as e:
+                ok, log = False, f"    ❌ Conversion failed: {e}\n"
+            print(log, end="")
+            yield ok
+
+
+def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, target_height=TARGET_HEIGHT, target_fps=TARGET_FPS,
+                   use_gpu=False, jobs=DEFAULT_JOBS, fast_seek=False):
     """Process all MP4 files in a folder structure"""
     
     input_path = Path(input_folder)
@@ -151,6 +560,10 @@ def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, targe
         print(f"❌ Input folder does not exist: {input_folder}")
         return
     
+    if use_gpu and not cuda_available():
+        print("⚠️ CUDA video decoding not available in this OpenCV build, using CPU")
+        use_gpu = False
+    
     # Create output folder
     output_path.mkdir(parents=True, exist_ok=True)
     
@@ -160,14 +573,13 @@ def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, targe
     print(f"Input:  {input_folder}")
     print(f"Output: {output_folder}")
     print(f"Target: {target_width}x{target_height} @ {target_fps}fps")
+    print(f"Decode: {'GPU (CUDA)' if use_gpu else 'CPU'}, {jobs} parallel job(s)")
     print(f"{'='*60}\n")
     
-    # Find all MP4 files (case-insensitive, avoid duplicates on Windows)
-    mp4_files_set = set()
-    for f in input_path.rglob("*"):
-        if f.suffix.lower() == ".mp4" and f.is_file():
-            mp4_files_set.add(f)
-    mp4_files = sorted(list(mp4_files_set))
+    # Find all MP4 files (case-insensitive). The glob filters on the name
+    # during the directory walk, so non-MP4 entries are never stat()ed, and a
+    # single pattern can't return duplicates on case-insensitive filesystems
+    mp4_files = sorted(input_path.rglob("*.[mM][pP]4"))
     
     if not mp4_files:
         print("❌ No MP4 files found!")
@@ -178,6 +590,7 @@ def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, targe
     converted = 0
     failed = 0
     
+    tasks = []
     for mp4_file in mp4_files:
         # Get relative path from input folder
         rel_path = mp4_file.relative_to(input_path)
@@ -191,9 +604,16 @@ def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, targe
         output_bin = output_dir / f"{base_name}.bin"
         output_manifest = output_dir / f"{base_name}_manifest.txt"
         
-        print(f"📹 {rel_path}")
-        
-        if convert_video(mp4_file, output_bin, output_manifest, target_width, target_height, target_fps):
+        tasks.append((rel_path, (mp4_file, output_bin, output_manifest, target_width, target_height, target_fps)))
+    
+    options = {"use_gpu": use_gpu, "fast_seek": fast_seek}
+    if jobs > 1:
+        results = _convert_parallel(tasks, options, jobs)
+    else:
+        results = _convert_serial(tasks, options)
+    
+    for ok in results:
+        if ok:
             converted += 1
         else:
             failed += 1
@@ -215,11 +635,8 @@ def process_folder(input_folder, output_folder, target_width=TARGET_WIDTH, targe
         f.write(f"height={target_height}\n")
         f.write(f"fps={target_fps}\n")
         f.write(f"\n# Files:\n")
-        for mp4_file in mp4_files:
-            rel_path = mp4_file.relative_to(input_path)
-            base_name = mp4_file.stem
-            bin_path = rel_path.parent / f"{base_name}.bin"
-            f.write(f"{bin_path}\n")
+        f.write("".join(f"{mp4_file.relative_to(input_path).parent / (mp4_file.stem + '.bin')}\n"
+                        for mp4_file in mp4_files))
     
     print(f"\n📄 Summary saved to: {summary_path}")
     print(f"\n🎉 Done! Copy the '{output_folder}' contents to your SD card.")
@@ -246,10 +663,18 @@ Examples:
                         help=f'Target height (default: {TARGET_HEIGHT})')
     parser.add_argument('-f', '--fps', type=int, default=TARGET_FPS,
                         help=f'Target FPS (default: {TARGET_FPS})')
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'Clips to convert in parallel processes (default: {DEFAULT_JOBS})')
+    parser.add_argument('--gpu', action='store_true',
+                        help='Decode, resize and convert on an NVIDIA GPU (needs OpenCV built with CUDA)')
+    parser.add_argument('--fast-seek', action='store_true',
+                        help=f'Seek between kept frames when skipping {FAST_SEEK_MIN_SKIP}+ frames '
+                             '(faster low-FPS previews; FFmpeg backend only)')
     
     args = parser.parse_args()
     
-    process_folder(args.input, args.output, args.width, args.height, args.fps)
+    process_folder(args.input, args.output, args.width, args.height, args.fps, args.gpu, args.jobs,
+                   args.fast_seek)
 
 
 if __name__ == "__main__":